@@ -3,42 +3,15 @@ Dependency injection container.
 
 This module provides the dependency injection container for the application,
 which manages the instantiation and wiring of application components.
+
+The adapter and application modules are imported inside the provider
+factories rather than at module level, so importing the container (or
+anything that transitively imports it) does not pay for redis, SQLAlchemy
+and Flask until the corresponding provider is first resolved.
 """
 import logging
 
-import redis
-from dependency_injector import containers, providers
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import scoped_session, sessionmaker
-
-from adapter.cache.redis_cache import ExampleRedisCache, RedisCache
-from adapter.event.memory_event_bus import MemoryEventBus
-from adapter.http.app_factory import create_app
-from adapter.http.flask_app import register_resources
-from adapter.http.resources.example_resource import ExampleListResource, ExampleResource
-from adapter.repository import db_registry
-from adapter.repository.sqlalchemy import (
-    create_mysql_engine,
-    create_postgresql_engine,
-    create_scoped_session,
-    create_session_factory,
-    init_db_schema,
-)
-from adapter.repository.sqlalchemy.example_repository import SQLAlchemyExampleRepository
-from adapter.repository.sqlalchemy.models import Base
-from application.event.example_event_handlers import (
-    ExampleCreatedEventHandler,
-    ExampleDeletedEventHandler,
-    ExampleUpdatedEventHandler,
-)
-from application.service.example_app_service import ExampleAppService
-from domain.event.example_events import (
-    ExampleCreatedEvent,
-    ExampleDeletedEvent,
-    ExampleUpdatedEvent,
-)
-from domain.service.example_service_impl import ExampleServiceImpl
+from util.di import Configuration, Factory, Resource, SimpleContainer, Singleton
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +26,8 @@ def register_resources_with_deps(api):
     Args:
         api: Flask-RESTful API instance
     """
+    from adapter.http.flask_app import register_resources
+
     # Get global container instance
     container = _get_container_instance()
 
@@ -88,6 +63,8 @@ def register_databases(
         postgresql_session: PostgreSQL session instance
         default_db: Default database name
     """
+    from adapter.repository import db_registry
+
     db_registry.register("mysql", mysql_engine, mysql_session)
     db_registry.register("postgresql", postgresql_engine, postgresql_session)
     if default_db in ("mysql", "postgresql"):
@@ -97,7 +74,128 @@ def register_databases(
     )
 
 
-class AppContainer(containers.DeclarativeContainer):
+def _make_mysql_engine(url, echo):
+    """Build the MySQL engine, importing SQLAlchemy on first use."""
+    from adapter.repository.sqlalchemy import create_mysql_engine
+
+    return create_mysql_engine(url, echo=echo)
+
+
+def _make_postgresql_engine(url, echo):
+    """Build the PostgreSQL engine, importing SQLAlchemy on first use."""
+    from adapter.repository.sqlalchemy import create_postgresql_engine
+
+    return create_postgresql_engine(url, echo=echo)
+
+
+def _make_session_factory(engine):
+    """Build a session factory for an engine."""
+    from adapter.repository.sqlalchemy import create_session_factory
+
+    return create_session_factory(engine=engine)
+
+
+def _make_scoped_session(session_factory):
+    """Build a scoped session from a session factory."""
+    from adapter.repository.sqlalchemy import create_scoped_session
+
+    return create_scoped_session(session_factory)
+
+
+def _make_redis_client(host, port, db):
+    """Build the Redis client, importing redis on first use."""
+    import redis
+
+    return redis.Redis(host=host, port=port, db=db, decode_responses=False)
+
+
+def _make_redis_cache(redis_client, prefix):
+    """Build the generic Redis cache."""
+    from adapter.cache.redis_cache import RedisCache
+
+    return RedisCache(redis_client=redis_client, prefix=prefix)
+
+
+def _make_example_cache(redis_cache):
+    """Build the Example-specific Redis cache."""
+    from adapter.cache.redis_cache import ExampleRedisCache
+
+    return ExampleRedisCache(redis_cache=redis_cache)
+
+
+def _make_event_bus():
+    """Build the in-memory event bus."""
+    from adapter.event.memory_event_bus import MemoryEventBus
+
+    return MemoryEventBus()
+
+
+def _make_created_handler():
+    """Build the example-created event handler."""
+    from application.event.example_event_handlers import ExampleCreatedEventHandler
+
+    return ExampleCreatedEventHandler()
+
+
+def _make_updated_handler():
+    """Build the example-updated event handler."""
+    from application.event.example_event_handlers import ExampleUpdatedEventHandler
+
+    return ExampleUpdatedEventHandler()
+
+
+def _make_deleted_handler():
+    """Build the example-deleted event handler."""
+    from application.event.example_event_handlers import ExampleDeletedEventHandler
+
+    return ExampleDeletedEventHandler()
+
+
+def _make_example_repository(db_name):
+    """Build the SQLAlchemy-backed Example repository."""
+    from adapter.repository.sqlalchemy.example_repository import (
+        SQLAlchemyExampleRepository,
+    )
+
+    return SQLAlchemyExampleRepository(db_name=db_name)
+
+
+def _make_example_service(repository, event_bus):
+    """Build the Example domain service."""
+    from domain.service.example_service_impl import ExampleServiceImpl
+
+    return ExampleServiceImpl(repository=repository, event_bus=event_bus)
+
+
+def _make_example_app_service(example_service):
+    """Build the Example application service."""
+    from application.service.example_app_service import ExampleAppService
+
+    return ExampleAppService(example_service=example_service)
+
+
+def _make_example_resource(example_app_service):
+    """Build the single-example HTTP resource."""
+    from adapter.http.resources.example_resource import ExampleResource
+
+    return ExampleResource(example_app_service=example_app_service)
+
+
+def _make_example_list_resource(example_app_service):
+    """Build the example-collection HTTP resource."""
+    from adapter.http.resources.example_resource import ExampleListResource
+
+    return ExampleListResource(example_app_service=example_app_service)
+
+
+def _make_flask_app(config, register_resources_func):
+    """Build the Flask app, importing the HTTP adapter on first use."""
+    from adapter.http.app_factory import create_app
+
+    return create_app(config=config, register_resources_func=register_resources_func)
+
+
+class AppContainer(SimpleContainer):
     """
     Dependency injection container for the application.
 
@@ -106,42 +204,38 @@ class AppContainer(containers.DeclarativeContainer):
     """
 
     # Configuration
-    config = providers.Configuration()
+    config = Configuration()
 
     # Logging
-    logging = providers.Resource(
+    logging = Resource(
         logging.basicConfig, level=config.logging.level, format=config.logging.format
     )
 
     # Database
-    mysql_engine = providers.Singleton(
-        create_mysql_engine,
+    mysql_engine = Singleton(
+        _make_mysql_engine,
         config.db.mysql.url,
         echo=config.db.mysql.echo,
     )
 
-    postgresql_engine = providers.Singleton(
-        create_postgresql_engine,
+    postgresql_engine = Singleton(
+        _make_postgresql_engine,
         config.db.postgresql.url,
         echo=config.db.postgresql.echo,
     )
 
-    mysql_session_factory = providers.Singleton(
-        create_session_factory, engine=mysql_engine
-    )
+    mysql_session_factory = Singleton(_make_session_factory, engine=mysql_engine)
 
-    postgresql_session_factory = providers.Singleton(
-        create_session_factory, engine=postgresql_engine
+    postgresql_session_factory = Singleton(
+        _make_session_factory, engine=postgresql_engine
     )
 
-    mysql_session = providers.Singleton(create_scoped_session, mysql_session_factory)
+    mysql_session = Singleton(_make_scoped_session, mysql_session_factory)
 
-    postgresql_session = providers.Singleton(
-        create_scoped_session, postgresql_session_factory
-    )
+    postgresql_session = Singleton(_make_scoped_session, postgresql_session_factory)
 
     # Database Registry
-    db_registry_configurator = providers.Resource(
+    db_registry_configurator = Resource(
         register_databases,
         mysql_engine=mysql_engine,
         postgresql_engine=postgresql_engine,
@@ -151,58 +245,57 @@ class AppContainer(containers.DeclarativeContainer):
     )
 
     # Redis
-    redis_client = providers.Singleton(
-        redis.Redis,
+    redis_client = Singleton(
+        _make_redis_client,
         host=config.redis.host,
         port=config.redis.port,
         db=config.redis.db,
-        decode_responses=False,
     )
 
     # Cache
-    redis_cache = providers.Singleton(
-        RedisCache, redis_client=redis_client, prefix=config.redis.prefix
+    redis_cache = Singleton(
+        _make_redis_cache, redis_client=redis_client, prefix=config.redis.prefix
     )
 
-    example_cache = providers.Singleton(ExampleRedisCache, redis_cache=redis_cache)
+    example_cache = Singleton(_make_example_cache, redis_cache=redis_cache)
 
     # Event Bus
-    event_bus = providers.Singleton(MemoryEventBus)
+    event_bus = Singleton(_make_event_bus)
 
     # Event Handlers
-    example_created_handler = providers.Singleton(ExampleCreatedEventHandler)
+    example_created_handler = Singleton(_make_created_handler)
 
-    example_updated_handler = providers.Singleton(ExampleUpdatedEventHandler)
+    example_updated_handler = Singleton(_make_updated_handler)
 
-    example_deleted_handler = providers.Singleton(ExampleDeletedEventHandler)
+    example_deleted_handler = Singleton(_make_deleted_handler)
 
     # Repositories
-    example_repository = providers.Singleton(
-        SQLAlchemyExampleRepository, db_name=config.db.examples_db
+    example_repository = Singleton(
+        _make_example_repository, db_name=config.db.examples_db
     )
 
     # Domain Services
-    example_service = providers.Singleton(
-        ExampleServiceImpl, repository=example_repository, event_bus=event_bus
+    example_service = Singleton(
+        _make_example_service, repository=example_repository, event_bus=event_bus
     )
 
     # Application Services
-    example_app_service = providers.Singleton(
-        ExampleAppService, example_service=example_service
+    example_app_service = Singleton(
+        _make_example_app_service, example_service=example_service
     )
 
     # HTTP Resources
-    example_resource = providers.Factory(
-        ExampleResource, example_app_service=example_app_service
+    example_resource = Factory(
+        _make_example_resource, example_app_service=example_app_service
     )
 
-    example_list_resource = providers.Factory(
-        ExampleListResource, example_app_service=example_app_service
+    example_list_resource = Factory(
+        _make_example_list_resource, example_app_service=example_app_service
     )
 
     # Flask App
-    flask_app = providers.Singleton(
-        create_app,
+    flask_app = Singleton(
+        _make_flask_app,
         config=config.flask,
         register_resources_func=register_resources_with_deps,
     )
@@ -232,6 +325,8 @@ def initialize_database(container):
     Args:
         container: The dependency injection container
     """
+    from adapter.repository.sqlalchemy import init_db_schema
+
     # Ensure database registry is configured
     db_registry_configurator = container.db_registry_configurator()
 
@@ -4,7 +4,7 @@ In-memory event bus implementation.
 This module provides an in-memory implementation of the event bus interface.
 """
 import logging
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List
 
 from domain.event.event import DomainEvent
 from domain.event.event_bus import EventBus, EventHandler
@@ -50,6 +50,31 @@ class MemoryEventBus(EventBus):
                     f"Error handling event {event.event_id} with handler {handler.__class__.__name__}: {e}"
                 )
 
+    def publish_many(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Publish a batch of domain events in one dispatch pass.
+
+        Binds the handler lookup once, so bulk flows avoid the per-event
+        method resolution that N separate publish calls would pay.
+
+        Args:
+            events: The domain events to publish, in order
+        """
+        get_handlers = self._handlers.get
+        for event in events:
+            handlers = get_handlers(event.event_type)
+            if not handlers:
+                logger.debug(f"No handlers registered for event type: {event.event_type}")
+                continue
+
+            for handler in handlers:
+                try:
+                    handler.handle(event)
+                except Exception as e:
+                    logger.exception(
+                        f"Error handling event {event.event_id} with handler {handler.__class__.__name__}: {e}"
+                    )
+
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
         """
         Subscribe to a specific event type.
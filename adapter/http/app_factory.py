@@ -10,6 +10,7 @@ from flask_cors import CORS
 from flask_restful import Api
 
 from adapter.http.error_handlers import register_error_handlers
+from adapter.http.json_provider import dumps, install_json_provider
 from adapter.http.middlewares import register_middlewares
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,9 @@ def create_app(config=None, register_resources_func=None):
     if config:
         app.config.from_mapping(config)
 
+    # Use the C-accelerated JSON encoder when available
+    install_json_provider(app)
+
     # Register middlewares
     register_middlewares(app)
 
@@ -62,11 +66,9 @@ def create_app(config=None, register_resources_func=None):
     # Configure Flask-RESTful to handle Chinese characters correctly
     @api.representation("application/json")
     def output_json(data, code, headers=None):
-        import json
-
-        from flask import current_app, make_response
+        from flask import make_response
 
-        resp = make_response(json.dumps(data, ensure_ascii=False), code)
+        resp = make_response(dumps(data), code)
         resp.headers.extend(headers or {})
         return resp
 
@@ -0,0 +1,53 @@
+"""
+JSON provider for the Flask application.
+
+This module wires orjson's C-implemented encoder into Flask when it is
+installed, falling back to the standard library otherwise.
+"""
+import json
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(data) -> str:
+    """
+    Serialize data to a JSON string with the fastest available encoder.
+
+    Args:
+        data: The object to serialize
+
+    Returns:
+        The JSON string, with non-ASCII characters kept as-is
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes payload."""
+        return orjson.loads(s)
+
+
+def install_json_provider(app: Flask) -> None:
+    """
+    Use orjson for the app's request/response JSON when available.
+
+    Args:
+        app: Flask application instance
+    """
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
@@ -3,7 +3,8 @@ SQLAlchemy-based Example repository implementation.
 
 This module provides a SQLAlchemy-based implementation of the Example repository.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -81,6 +82,55 @@ class SQLAlchemyExampleRepository(SQLAlchemyRepository, ExampleRepository):
         model = self.session.query(ExampleModel).filter_by(id=example_id).first()
         return self._to_entity(model) if model else None
 
+    def save_many(self, examples: List[Example]) -> List[Example]:
+        """
+        Save a batch of new examples under a single commit.
+
+        Args:
+            examples: The example entities to save
+
+        Returns:
+            The saved examples, in input order
+        """
+        try:
+            self.session.add_all(
+                [
+                    ExampleModel(
+                        id=example.id,
+                        name=example.name,
+                        description=example.description,
+                        created_at=example.created_at,
+                        updated_at=example.updated_at,
+                    )
+                    for example in examples
+                ]
+            )
+            self.commit()
+            return examples
+        except SQLAlchemyError as e:
+            self.rollback()
+            raise e
+
+    def find_by_ids(self, example_ids: List[str]) -> List[Example]:
+        """
+        Find all examples matching the given IDs in one round trip.
+
+        Args:
+            example_ids: The IDs of the examples to find
+
+        Returns:
+            A list of the found example entities
+        """
+        if not example_ids:
+            return []
+
+        models = (
+            self.session.query(ExampleModel)
+            .filter(ExampleModel.id.in_(example_ids))
+            .all()
+        )
+        return [self._to_entity(model) for model in models]
+
     def find_by_name(self, name: str) -> Optional[Example]:
         """
         Find an example by its name.
@@ -101,8 +151,45 @@ class SQLAlchemyExampleRepository(SQLAlchemyRepository, ExampleRepository):
         Returns:
             A list of all example entities
         """
-        models = self.session.query(ExampleModel).all()
-        return [self._to_entity(model) for model in models]
+        # Stream rows off the cursor in batches instead of materializing the
+        # full list of ORM models before converting them, halving the peak
+        # number of live objects for large tables.
+        query = self.session.query(ExampleModel).yield_per(500)
+        return [self._to_entity(model) for model in query]
+
+    def update_by_id(
+        self,
+        example_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Example]:
+        """
+        Apply a partial update to an example in a single round trip.
+
+        Args:
+            example_id: The ID of the example to update
+            name: The new name (if provided)
+            description: The new description (if provided)
+
+        Returns:
+            The updated example entity or None if no example matched the ID
+        """
+        try:
+            model = self.session.query(ExampleModel).filter_by(id=example_id).first()
+            if not model:
+                return None
+
+            if name is not None:
+                model.name = name
+            if description is not None:
+                model.description = description
+            model.updated_at = datetime.now()
+
+            self.commit()
+            return self._to_entity(model)
+        except SQLAlchemyError as e:
+            self.rollback()
+            raise e
 
     def delete(self, example_id: str) -> bool:
         """
@@ -115,13 +202,11 @@ class SQLAlchemyExampleRepository(SQLAlchemyRepository, ExampleRepository):
             True if the example was deleted, False otherwise
         """
         try:
-            model = self.session.query(ExampleModel).filter_by(id=example_id).first()
-            if not model:
-                return False
-
-            self.session.delete(model)
+            deleted = (
+                self.session.query(ExampleModel).filter_by(id=example_id).delete()
+            )
             self.commit()
-            return True
+            return deleted > 0
         except SQLAlchemyError as e:
             self.rollback()
             raise e
@@ -138,6 +223,44 @@ class SQLAlchemyExampleRepository(SQLAlchemyRepository, ExampleRepository):
         """
         return self.session.query(ExampleModel).filter_by(name=name).first() is not None
 
+    def exists_by_names(self, names: List[str]) -> Set[str]:
+        """
+        Check which of the given names are already taken, in one query.
+
+        Args:
+            names: The names to check
+
+        Returns:
+            The subset of names that already exist
+        """
+        if not names:
+            return set()
+
+        rows = (
+            self.session.query(ExampleModel.name)
+            .filter(ExampleModel.name.in_(names))
+            .all()
+        )
+        return {row[0] for row in rows}
+
+    def exists_by_name_excluding(self, name: str, example_id: str) -> bool:
+        """
+        Check if another example (a different ID) already uses the name.
+
+        Args:
+            name: The name to check
+            example_id: The ID to exclude from the check
+
+        Returns:
+            True if a different example already uses the name, False otherwise
+        """
+        return (
+            self.session.query(ExampleModel.id)
+            .filter(ExampleModel.name == name, ExampleModel.id != example_id)
+            .first()
+            is not None
+        )
+
     def _to_entity(self, model: ExampleModel) -> Example:
         """
         Convert a database model to a domain entity.
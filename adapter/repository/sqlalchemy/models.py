@@ -27,9 +27,9 @@ class ExampleModel(Base):
     id = Column(String(36), primary_key=True)
     name = Column(String(255), unique=True, nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.now())
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
     updated_at = Column(
-        DateTime, nullable=False, default=datetime.now(), onupdate=datetime.now()
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now
     )
 
     def __init__(
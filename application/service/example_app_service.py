@@ -20,6 +20,8 @@ class ExampleAppService:
     functionality related to the Example entity.
     """
 
+    __slots__ = ("_example_service",)
+
     def __init__(self, example_service: ExampleService):
         """
         Initialize the service with its dependencies.
@@ -108,4 +110,4 @@ class ExampleAppService:
             A list of all examples as dictionaries
         """
         examples = self._example_service.get_all_examples()
-        return [example.to_dict() for example in examples]
+        return Example.batch_to_dict(examples)
@@ -6,6 +6,7 @@ environment variables or configuration files.
 """
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -16,12 +17,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@lru_cache(maxsize=None)
 def load_config(config_path: str = None) -> Dict[str, Any]:
     """
     Load application configuration.
 
     Configuration is loaded from a YAML file and can be overridden by
-    environment variables.
+    environment variables. The result is memoized per path, so repeated
+    calls share one configuration dict instead of re-reading the
+    environment and re-parsing the YAML file; callers must treat it as
+    read-only.
 
     Args:
         config_path: Path to the YAML configuration file
@@ -4,11 +4,18 @@ Domain event base classes.
 This module defines the base classes for domain events in the system.
 Domain events represent something interesting that happened in the domain.
 """
-import uuid
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict
+from uuid import uuid4 as _uuid4
+
+_now = datetime.now
+
+
+def _new_event_id() -> str:
+    """Generate a fresh event ID."""
+    return str(_uuid4())
 
 
 @dataclass
@@ -19,18 +26,15 @@ class DomainEvent(ABC):
     Domain events represent something interesting that happened in the domain.
     They are immutable and contain all the information necessary to describe
     the event that happened.
-    """
 
-    event_id: str
-    event_type: str
-    occurred_at: datetime
+    The bookkeeping fields are keyword-only with real defaults, so concrete
+    events are constructed from their payload alone instead of passing
+    placeholder values that a __post_init__ pass then overwrites.
+    """
 
-    def __post_init__(self):
-        """Initialize default values after instance creation."""
-        if not hasattr(self, "event_id") or not self.event_id:
-            self.event_id = str(uuid.uuid4())
-        if not hasattr(self, "occurred_at") or not self.occurred_at:
-            self.occurred_at = datetime.now()
+    event_id: str = field(default_factory=_new_event_id, kw_only=True)
+    event_type: str = field(default="", kw_only=True)
+    occurred_at: datetime = field(default_factory=_now, kw_only=True)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -39,18 +43,11 @@ class DomainEvent(ABC):
         Returns:
             Dictionary representation of the event
         """
-        result = {
-            "event_id": self.event_id,
-            "event_type": self.event_type,
-            "occurred_at": self.occurred_at.isoformat(),
+        # Build the dictionary in a single pass over the instance fields
+        # (definition order already puts event_id/event_type/occurred_at
+        # first), avoiding the base-dict-plus-update resize path and the
+        # per-key membership checks.
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in self.__dict__.items()
         }
-
-        # Add all additional fields from the dataclass
-        for key, value in self.__dict__.items():
-            if key not in result:
-                if isinstance(value, datetime):
-                    result[key] = value.isoformat()
-                else:
-                    result[key] = value
-
-        return result
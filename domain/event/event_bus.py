@@ -5,7 +5,7 @@ This module defines the interface for the event bus, which is responsible for
 publishing domain events and notifying subscribers.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List
+from typing import Any, Callable, Iterable, List
 
 from domain.event.event import DomainEvent
 
@@ -17,6 +17,8 @@ class EventHandler(ABC):
     Event handlers are responsible for reacting to domain events.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def handle(self, event: DomainEvent) -> None:
         """
@@ -36,6 +38,8 @@ class EventBus(ABC):
     It follows the publish-subscribe pattern.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def publish(self, event: DomainEvent) -> None:
         """
@@ -46,6 +50,16 @@ class EventBus(ABC):
         """
         pass
 
+    @abstractmethod
+    def publish_many(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Publish a batch of domain events in one dispatch pass.
+
+        Args:
+            events: The domain events to publish, in order
+        """
+        pass
+
     @abstractmethod
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
         """
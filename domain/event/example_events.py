@@ -3,8 +3,7 @@ Example domain events.
 
 This module defines the domain events related to the Example entity.
 """
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
 from typing import Optional
 
 from domain.event.event import DomainEvent
@@ -21,11 +20,7 @@ class ExampleCreatedEvent(DomainEvent):
     example_id: str
     name: str
     description: Optional[str] = None
-
-    def __post_init__(self):
-        """Initialize the event type after instance creation."""
-        self.event_type = "example.created"
-        super().__post_init__()
+    event_type: str = field(default="example.created", kw_only=True)
 
 
 @dataclass
@@ -39,11 +34,7 @@ class ExampleUpdatedEvent(DomainEvent):
     example_id: str
     name: str
     description: Optional[str] = None
-
-    def __post_init__(self):
-        """Initialize the event type after instance creation."""
-        self.event_type = "example.updated"
-        super().__post_init__()
+    event_type: str = field(default="example.updated", kw_only=True)
 
 
 @dataclass
@@ -55,8 +46,4 @@ class ExampleDeletedEvent(DomainEvent):
     """
 
     example_id: str
-
-    def __post_init__(self):
-        """Initialize the event type after instance creation."""
-        self.event_type = "example.deleted"
-        super().__post_init__()
+    event_type: str = field(default="example.deleted", kw_only=True)
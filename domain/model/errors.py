@@ -11,18 +11,25 @@ from typing import Optional
 class DomainError(Exception):
     """Base exception for all domain errors."""
 
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
+    __slots__ = ()
+
+    @property
+    def message(self) -> str:
+        """The human-readable error message."""
+        # Exception.__init__ already stores the message in args[0]; exposing
+        # it as a property avoids duplicating it as an instance attribute.
+        return self.args[0] if self.args else ""
 
 
 class EntityNotFoundError(DomainError):
     """Exception raised when an entity cannot be found."""
 
     def __init__(self, entity_name: str, entity_id: Optional[str] = None):
-        message = f"{entity_name} not found"
-        if entity_id:
-            message = f"{entity_name} with id '{entity_id}' not found"
+        message = (
+            f"{entity_name} with id '{entity_id}' not found"
+            if entity_id
+            else f"{entity_name} not found"
+        )
         super().__init__(message)
 
 
@@ -5,10 +5,14 @@ This module contains the Example entity, which represents a core business concep
 in the domain model. It follows domain-driven design principles by encapsulating
 business rules and behaviors.
 """
-import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import uuid4 as _uuid4
+
+# Bound once at import time so hot call sites resolve a single local/global
+# name instead of a LOAD_GLOBAL + LOAD_ATTR pair per call.
+_now = datetime.now
 
 
 @dataclass
@@ -24,15 +28,8 @@ class Example:
     id: str
     name: str
     description: Optional[str] = None
-    created_at: datetime = None
-    updated_at: datetime = None
-
-    def __post_init__(self):
-        """Initialize default values after instance creation."""
-        if not self.created_at:
-            self.created_at = datetime.now()
-        if not self.updated_at:
-            self.updated_at = self.created_at
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
 
     @classmethod
     def create(cls, name: str, description: Optional[str] = None) -> "Example":
@@ -46,7 +43,15 @@ class Example:
         Returns:
             A new Example instance with generated ID
         """
-        return cls(id=str(uuid.uuid4()), name=name, description=description)
+        # A single clock read keeps created_at and updated_at identical.
+        now = _now()
+        return cls(
+            id=str(_uuid4()),
+            name=name,
+            description=description,
+            created_at=now,
+            updated_at=now,
+        )
 
     def update(
         self, name: Optional[str] = None, description: Optional[str] = None
@@ -62,7 +67,7 @@ class Example:
             self.name = name
         if description is not None:
             self.description = description
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -79,6 +84,32 @@ class Example:
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
 
+    @classmethod
+    def batch_to_dict(cls, examples: Iterable["Example"]) -> List[Dict[str, Any]]:
+        """
+        Convert a batch of entities to dictionaries in one pass.
+
+        Binds datetime.isoformat once so serializing large find_all()
+        results avoids a method lookup per timestamp.
+
+        Args:
+            examples: The entities to convert
+
+        Returns:
+            List of dictionary representations, in iteration order
+        """
+        _iso = datetime.isoformat
+        return [
+            {
+                "id": example.id,
+                "name": example.name,
+                "description": example.description,
+                "created_at": _iso(example.created_at) if example.created_at else None,
+                "updated_at": _iso(example.updated_at) if example.updated_at else None,
+            }
+            for example in examples
+        ]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Example":
         """
@@ -98,10 +129,11 @@ class Example:
         if isinstance(updated_at, str):
             updated_at = datetime.fromisoformat(updated_at)
 
+        created_at = created_at or _now()
         return cls(
             id=data["id"],
             name=data["name"],
             description=data.get("description"),
             created_at=created_at,
-            updated_at=updated_at,
+            updated_at=updated_at or created_at,
         )
@@ -10,7 +10,7 @@ communicate with the outside world. The actual implementation (adapter) will be
 provided by the infrastructure layer.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from domain.model.example import Example
 
@@ -24,6 +24,8 @@ class ExampleRepository(ABC):
     providing a collection-like interface for domain objects.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def save(self, example: Example) -> Example:
         """
@@ -50,6 +52,20 @@ class ExampleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_ids(self, example_ids: List[str]) -> List[Example]:
+        """
+        Find all examples matching the given IDs in one round trip.
+
+        Args:
+            example_ids: The IDs of the examples to find
+
+        Returns:
+            A list of the found example entities; IDs with no match are
+            silently skipped
+        """
+        pass
+
     @abstractmethod
     def find_by_name(self, name: str) -> Optional[Example]:
         """
@@ -73,6 +89,42 @@ class ExampleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(self, examples: List[Example]) -> List[Example]:
+        """
+        Save a batch of examples in a single round trip.
+
+        Args:
+            examples: The example entities to save
+
+        Returns:
+            The saved examples, in input order
+        """
+        pass
+
+    @abstractmethod
+    def update_by_id(
+        self,
+        example_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Example]:
+        """
+        Apply a partial update to an example in a single round trip.
+
+        Fuses the find-then-save pair into one repository call so a state
+        change costs one query instead of a read-modify-write cycle.
+
+        Args:
+            example_id: The ID of the example to update
+            name: The new name (if provided)
+            description: The new description (if provided)
+
+        Returns:
+            The updated example entity or None if no example matched the ID
+        """
+        pass
+
     @abstractmethod
     def delete(self, example_id: str) -> bool:
         """
@@ -98,3 +150,30 @@ class ExampleRepository(ABC):
             True if an example with the given name exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def exists_by_names(self, names: List[str]) -> Set[str]:
+        """
+        Check which of the given names are already taken, in one query.
+
+        Args:
+            names: The names to check
+
+        Returns:
+            The subset of names that already exist
+        """
+        pass
+
+    @abstractmethod
+    def exists_by_name_excluding(self, name: str, example_id: str) -> bool:
+        """
+        Check if another example (a different ID) already uses the name.
+
+        Args:
+            name: The name to check
+            example_id: The ID to exclude from the check
+
+        Returns:
+            True if a different example already uses the name, False otherwise
+        """
+        pass
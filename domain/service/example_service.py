@@ -5,7 +5,7 @@ This module defines the domain service for the Example entity. Domain services
 contain domain logic that doesn't naturally fit within an entity or value object.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from domain.model.example import Example
 
@@ -18,6 +18,8 @@ class ExampleService(ABC):
     Example entity or related value objects.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create_example(self, name: str, description: Optional[str] = None) -> Example:
         """
@@ -35,6 +37,25 @@ class ExampleService(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_examples(
+        self, items: List[Tuple[str, Optional[str]]]
+    ) -> List[Example]:
+        """
+        Create a batch of examples with one duplicate check and one save.
+
+        Args:
+            items: (name, description) pairs for the examples to create
+
+        Returns:
+            The created examples, in input order
+
+        Raises:
+            ExampleNameAlreadyExistsError: If any requested name is already
+                taken or appears twice in the batch
+        """
+        pass
+
     @abstractmethod
     def update_example(
         self,
@@ -88,6 +109,19 @@ class ExampleService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_examples_by_ids(self, example_ids: Iterable[str]) -> Dict[str, Example]:
+        """
+        Get several examples by their IDs in a single repository round trip.
+
+        Args:
+            example_ids: The IDs of the examples to get
+
+        Returns:
+            A mapping from ID to the found example; missing IDs are omitted
+        """
+        pass
+
     @abstractmethod
     def get_all_examples(self) -> List[Example]:
         """
@@ -3,7 +3,9 @@ Example domain service implementation.
 
 This module provides the implementation of the Example domain service.
 """
-from typing import List, Optional
+import copy
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from domain.event.event_bus import EventBus
 from domain.event.example_events import (
@@ -16,6 +18,10 @@ from domain.model.example import Example
 from domain.repository.example_repository import ExampleRepository
 from domain.service.example_service import ExampleService
 
+# Upper bound on the per-service read cache; the least recently used
+# entry is evicted once the cap is reached.
+_CACHE_MAX_SIZE = 256
+
 
 class ExampleServiceImpl(ExampleService):
     """
@@ -25,6 +31,8 @@ class ExampleServiceImpl(ExampleService):
     coordinates with the repository and event bus.
     """
 
+    __slots__ = ("_repository", "_event_bus", "_cache")
+
     def __init__(self, repository: ExampleRepository, event_bus: EventBus):
         """
         Initialize the service with its dependencies.
@@ -35,6 +43,48 @@ class ExampleServiceImpl(ExampleService):
         """
         self._repository = repository
         self._event_bus = event_bus
+        # Process-local read cache keyed by example ID. Entries are written
+        # through on every save and evicted on delete, so within this
+        # process a cache hit is always the latest saved state and a repeat
+        # read skips the repository round trip entirely. The cache holds
+        # private copies, is LRU-ordered and capped at _CACHE_MAX_SIZE so
+        # it neither grows unboundedly nor aliases entities callers may
+        # mutate.
+        self._cache: OrderedDict[str, Example] = OrderedDict()
+
+    def _cache_put(self, example: Example) -> None:
+        """
+        Store a private copy of an entity in the read cache.
+
+        Args:
+            example: The entity to cache
+        """
+        cache = self._cache
+        cache[example.id] = copy.copy(example)
+        cache.move_to_end(example.id)
+        if len(cache) > _CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+    def _find_example(self, example_id: str) -> Optional[Example]:
+        """
+        Look up an example, preferring the process-local cache.
+
+        Args:
+            example_id: The ID of the example to look up
+
+        Returns:
+            The found example entity or None if not found
+        """
+        cached = self._cache.get(example_id)
+        if cached is not None:
+            self._cache.move_to_end(example_id)
+            # Hand back a copy so callers mutating the result cannot
+            # poison later reads.
+            return copy.copy(cached)
+        example = self._repository.find_by_id(example_id)
+        if example is not None:
+            self._cache_put(example)
+        return example
 
     def create_example(self, name: str, description: Optional[str] = None) -> Example:
         """
@@ -59,13 +109,11 @@ class ExampleServiceImpl(ExampleService):
 
         # Save the example
         saved_example = self._repository.save(example)
+        self._cache_put(saved_example)
 
         # Publish an event
         self._event_bus.publish(
             ExampleCreatedEvent(
-                event_id="",  # Will be auto-generated
-                event_type="",  # Will be set by the event class
-                occurred_at=None,  # Will be auto-generated
                 example_id=saved_example.id,
                 name=saved_example.name,
                 description=saved_example.description,
@@ -74,6 +122,56 @@ class ExampleServiceImpl(ExampleService):
 
         return saved_example
 
+    def create_examples(
+        self, items: List[Tuple[str, Optional[str]]]
+    ) -> List[Example]:
+        """
+        Create a batch of examples with one duplicate check and one save.
+
+        A per-item loop over create_example would issue one existence check
+        and one save per entity; this path checks all names in a single
+        query, saves the batch in one commit and publishes the created
+        events in one dispatch pass.
+
+        Args:
+            items: (name, description) pairs for the examples to create
+
+        Returns:
+            The created examples, in input order
+
+        Raises:
+            ExampleNameAlreadyExistsError: If any requested name is already
+                taken or appears twice in the batch
+        """
+        names = [name for name, _ in items]
+
+        # Reject duplicates within the batch as well as against the store
+        conflicts = self._repository.exists_by_names(names)
+        if len(set(names)) != len(names):
+            seen = set()
+            conflicts = conflicts | {n for n in names if n in seen or seen.add(n)}
+        if conflicts:
+            raise ExampleNameAlreadyExistsError(", ".join(sorted(conflicts)))
+
+        examples = [
+            Example.create(name, description) for name, description in items
+        ]
+        saved_examples = self._repository.save_many(examples)
+
+        events = []
+        for example in saved_examples:
+            self._cache_put(example)
+            events.append(
+                ExampleCreatedEvent(
+                    example_id=example.id,
+                    name=example.name,
+                    description=example.description,
+                )
+            )
+        self._event_bus.publish_many(events)
+
+        return saved_examples
+
     def update_example(
         self,
         example_id: str,
@@ -95,27 +193,20 @@ class ExampleServiceImpl(ExampleService):
             EntityNotFoundError: If the example with the given ID doesn't exist
             ExampleNameAlreadyExistsError: If the new name is already used by another example
         """
-        # Get the example
-        example = self._repository.find_by_id(example_id)
-        if not example:
-            raise EntityNotFoundError("Example", example_id)
-
         # Check if the new name is already used by another example
-        if name and name != example.name and self._repository.exists_by_name(name):
+        if name and self._repository.exists_by_name_excluding(name, example_id):
             raise ExampleNameAlreadyExistsError(name)
 
-        # Update the example
-        example.update(name, description)
+        # Apply the update in a single fused round trip
+        updated_example = self._repository.update_by_id(example_id, name, description)
+        if not updated_example:
+            raise EntityNotFoundError("Example", example_id)
 
-        # Save the example
-        updated_example = self._repository.save(example)
+        self._cache_put(updated_example)
 
         # Publish an event
         self._event_bus.publish(
             ExampleUpdatedEvent(
-                event_id="",  # Will be auto-generated
-                event_type="",  # Will be set by the event class
-                occurred_at=None,  # Will be auto-generated
                 example_id=updated_example.id,
                 name=updated_example.name,
                 description=updated_example.description,
@@ -134,23 +225,16 @@ class ExampleServiceImpl(ExampleService):
         Returns:
             True if the example was deleted, False if it didn't exist
         """
-        # Check if the example exists
-        example = self._repository.find_by_id(example_id)
-        if not example:
-            return False
-
-        # Delete the example
+        # Delete the example; the repository reports whether a row matched,
+        # so no separate existence check is needed
         if not self._repository.delete(example_id):
             return False
 
+        self._cache.pop(example_id, None)
+
         # Publish an event
         self._event_bus.publish(
-            ExampleDeletedEvent(
-                event_id="",  # Will be auto-generated
-                event_type="",  # Will be set by the event class
-                occurred_at=None,  # Will be auto-generated
-                example_id=example_id,
-            )
+            ExampleDeletedEvent(example_id=example_id)
         )
 
         return True
@@ -168,11 +252,27 @@ class ExampleServiceImpl(ExampleService):
         Raises:
             EntityNotFoundError: If the example with the given ID doesn't exist
         """
-        example = self._repository.find_by_id(example_id)
+        example = self._find_example(example_id)
         if not example:
             raise EntityNotFoundError("Example", example_id)
         return example
 
+    def get_examples_by_ids(self, example_ids: Iterable[str]) -> Dict[str, Example]:
+        """
+        Get several examples by their IDs in a single repository round trip.
+
+        Batch callers previously had to loop over get_example, paying one
+        repository query per ID (the classic N+1 pattern).
+
+        Args:
+            example_ids: The IDs of the examples to get
+
+        Returns:
+            A mapping from ID to the found example; missing IDs are omitted
+        """
+        examples = self._repository.find_by_ids(list(example_ids))
+        return {example.id: example for example in examples}
+
     def get_all_examples(self) -> List[Example]:
         """
         Get all examples.
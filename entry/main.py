@@ -55,6 +55,12 @@ def main():
         format=config["logging"]["format"],
     )
 
+    # The configured format prints none of these, so skip collecting
+    # thread/process info on every log record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger.info(f"Starting application with config from {config_path}")
 
     # Create and configure the dependency injection container
@@ -16,35 +16,41 @@ from domain.model.errors import EntityNotFoundError, ExampleNameAlreadyExistsErr
 class TestExampleResource(unittest.TestCase):
     """Integration tests for the Example HTTP resources."""
 
-    def setUp(self):
-        """Set up test fixtures before each test."""
-        self.app = Flask(__name__)
-        self.app.testing = True
-        self.app.config["TESTING"] = True
+    @classmethod
+    def setUpClass(cls):
+        """Build the Flask app, API and mocked service once for the class.
+
+        Creating the app, registering resources and introspecting
+        ExampleAppService for the Mock spec is pure fixture overhead, so it
+        runs once; each test only resets the shared mock.
+        """
+        cls.app = Flask(__name__)
+        cls.app.testing = True
+        cls.app.config["TESTING"] = True
 
-        self.example_app_service = Mock(spec=ExampleAppService)
+        cls.example_app_service = Mock(spec=ExampleAppService)
 
         # Create a test client
-        self.client = self.app.test_client()
+        cls.client = cls.app.test_client()
 
         # Create API and register resources
-        api = Api(self.app)
+        api = Api(cls.app)
 
         # Properly inject dependencies
         api.add_resource(
             ExampleListResource,
             "/api/examples",
-            resource_class_kwargs={"example_app_service": self.example_app_service},
+            resource_class_kwargs={"example_app_service": cls.example_app_service},
         )
         api.add_resource(
             ExampleResource,
             "/api/examples/<string:example_id>",
-            resource_class_kwargs={"example_app_service": self.example_app_service},
+            resource_class_kwargs={"example_app_service": cls.example_app_service},
         )
 
-    def tearDown(self):
-        """Clean up after each test."""
-        pass
+    def setUp(self):
+        """Reset the shared mock before each test."""
+        self.example_app_service.reset_mock(return_value=True, side_effect=True)
 
     def test_get_example(self):
         """Test GET /api/examples/{id}."""
@@ -85,8 +91,9 @@ class TestExampleResource(unittest.TestCase):
         self.example_app_service.get_example.assert_called_once_with(example_id)
 
         self.assertEqual(response.status_code, 404)
-        self.assertIn("error", response.json)
-        self.assertIn("message", response.json)
+        body = response.json
+        self.assertIn("error", body)
+        self.assertIn("message", body)
 
     def test_update_example(self):
         """Test PUT /api/examples/{id}."""
@@ -143,8 +150,9 @@ class TestExampleResource(unittest.TestCase):
 
         # Assert
         self.assertEqual(response.status_code, 404)
-        self.assertIn("error", response.json)
-        self.assertIn("message", response.json)
+        body = response.json
+        self.assertIn("error", body)
+        self.assertIn("message", body)
 
     def test_update_example_name_exists(self):
         """Test PUT /api/examples/{id} with a name that already exists."""
@@ -166,8 +174,9 @@ class TestExampleResource(unittest.TestCase):
 
         # Assert
         self.assertEqual(response.status_code, 409)
-        self.assertIn("error", response.json)
-        self.assertIn("message", response.json)
+        body = response.json
+        self.assertIn("error", body)
+        self.assertIn("message", body)
 
     def test_delete_example(self):
         """Test DELETE /api/examples/{id}."""
@@ -198,8 +207,9 @@ class TestExampleResource(unittest.TestCase):
         self.example_app_service.delete_example.assert_called_once_with(example_id)
 
         self.assertEqual(response.status_code, 404)
-        self.assertIn("error", response.json)
-        self.assertIn("message", response.json)
+        body = response.json
+        self.assertIn("error", body)
+        self.assertIn("message", body)
 
     def test_get_all_examples(self):
         """Test GET /api/examples."""
@@ -284,8 +294,9 @@ class TestExampleResource(unittest.TestCase):
 
         # Assert
         self.assertEqual(response.status_code, 409)
-        self.assertIn("error", response.json)
-        self.assertIn("message", response.json)
+        body = response.json
+        self.assertIn("error", body)
+        self.assertIn("message", body)
 
     def test_create_example_invalid_data(self):
         """Test POST /api/examples with invalid data."""
@@ -303,8 +314,9 @@ class TestExampleResource(unittest.TestCase):
         self.example_app_service.create_example.assert_not_called()
 
         self.assertEqual(response.status_code, 400)
-        self.assertIn("error", response.json)
-        self.assertIn("message", response.json)
+        body = response.json
+        self.assertIn("error", body)
+        self.assertIn("message", body)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Tests for the Example application service.
 """
 import unittest
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 from application.service.example_app_service import ExampleAppService
 from domain.model.errors import EntityNotFoundError, ExampleNameAlreadyExistsError
@@ -10,13 +10,27 @@ from domain.model.example import Example
 from domain.service.example_service import ExampleService
 
 
+def _subset(result, keys):
+    """Project a result dict onto the given keys for one-shot comparison."""
+    return {key: result[key] for key in keys}
+
+
 class TestExampleAppService(unittest.TestCase):
     """Test cases for the Example application service."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the mocked service and app service once for the class.
+
+        Mock(spec=...) introspects the spec class on every call, so the
+        mock is created once and only reset between tests.
+        """
+        cls.example_service = Mock(spec=ExampleService)
+        cls.app_service = ExampleAppService(cls.example_service)
+
     def setUp(self):
-        """Set up test fixtures before each test."""
-        self.example_service = Mock(spec=ExampleService)
-        self.app_service = ExampleAppService(self.example_service)
+        """Reset the shared mock before each test."""
+        self.example_service.reset_mock(return_value=True, side_effect=True)
 
     def test_create_example(self):
         """Test creating a new example."""
@@ -34,9 +48,10 @@ class TestExampleAppService(unittest.TestCase):
         # Assert
         self.example_service.create_example.assert_called_once_with(name, description)
 
-        self.assertEqual(result["id"], "123")
-        self.assertEqual(result["name"], name)
-        self.assertEqual(result["description"], description)
+        self.assertEqual(
+            _subset(result, ("id", "name", "description")),
+            {"id": "123", "name": name, "description": description},
+        )
 
     def test_create_example_error(self):
         """Test error handling when creating an example."""
@@ -70,9 +85,10 @@ class TestExampleAppService(unittest.TestCase):
             example_id, name, description
         )
 
-        self.assertEqual(result["id"], example_id)
-        self.assertEqual(result["name"], name)
-        self.assertEqual(result["description"], description)
+        self.assertEqual(
+            _subset(result, ("id", "name", "description")),
+            {"id": example_id, "name": name, "description": description},
+        )
 
     def test_update_example_error(self):
         """Test error handling when updating an example."""
@@ -134,9 +150,10 @@ class TestExampleAppService(unittest.TestCase):
         # Assert
         self.example_service.get_example.assert_called_once_with(example_id)
 
-        self.assertEqual(result["id"], example_id)
-        self.assertEqual(result["name"], name)
-        self.assertEqual(result["description"], description)
+        self.assertEqual(
+            _subset(result, ("id", "name", "description")),
+            {"id": example_id, "name": name, "description": description},
+        )
 
     def test_get_example_error(self):
         """Test error handling when getting an example."""
@@ -1,15 +1,41 @@
 """
 Tests for the Example domain model.
 """
+import copy
 import unittest
 from datetime import datetime, timedelta
 
 from domain.model.example import Example
 
+# Fixed timestamps keep the serialization tests deterministic and avoid
+# per-run clock reads.
+_T0 = datetime(2024, 1, 1, 12, 0, 0)
+_T1 = _T0 + timedelta(hours=1)
+
 
 class TestExample(unittest.TestCase):
     """Test cases for the Example domain entity."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared timestamps and serialized form once for the class.
+
+        The conversion tests only need a stable pair of timestamps and
+        their ISO strings, so they are allocated once instead of per test.
+        """
+        cls._created_at = _T0
+        cls._updated_at = _T1
+        cls._example_dict = {
+            "id": "123",
+            "name": "Test Example",
+            "description": "This is a test example",
+            "created_at": cls._created_at.isoformat(),
+            "updated_at": cls._updated_at.isoformat(),
+        }
+        # Mutation tests copy this instead of paying for a fresh UUID
+        # and clock read per test
+        cls._base = Example.create("Original Name", "Original Description")
+
     def test_create(self):
         """Test creating a new example."""
         name = "Test Example"
@@ -26,10 +52,9 @@ class TestExample(unittest.TestCase):
 
     def test_update(self):
         """Test updating an example."""
-        example = Example.create("Original Name", "Original Description")
+        example = copy.copy(self._base)
         original_created_at = example.created_at
 
-        # Wait a bit to ensure updated_at will be different
         example.update(name="New Name", description="New Description")
 
         self.assertEqual(example.name, "New Name")
@@ -39,7 +64,7 @@ class TestExample(unittest.TestCase):
 
     def test_update_partial(self):
         """Test partial update of an example."""
-        example = Example.create("Original Name", "Original Description")
+        example = copy.copy(self._base)
 
         # Update only name
         example.update(name="New Name")
@@ -55,49 +80,40 @@ class TestExample(unittest.TestCase):
 
     def test_to_dict(self):
         """Test converting an example to a dictionary."""
-        name = "Test Example"
-        description = "This is a test example"
-        created_at = datetime.now()
-        updated_at = created_at + timedelta(hours=1)
-
         example = Example(
             id="123",
-            name=name,
-            description=description,
-            created_at=created_at,
-            updated_at=updated_at,
+            name="Test Example",
+            description="This is a test example",
+            created_at=self._created_at,
+            updated_at=self._updated_at,
         )
 
         example_dict = example.to_dict()
 
-        self.assertEqual(example_dict["id"], "123")
-        self.assertEqual(example_dict["name"], name)
-        self.assertEqual(example_dict["description"], description)
-        self.assertEqual(example_dict["created_at"], created_at.isoformat())
-        self.assertEqual(example_dict["updated_at"], updated_at.isoformat())
+        self.assertEqual(example_dict, self._example_dict)
 
-    def test_from_dict(self):
-        """Test creating an example from a dictionary."""
-        name = "Test Example"
-        description = "This is a test example"
-        created_at = datetime.now()
-        updated_at = created_at + timedelta(hours=1)
+    def test_batch_to_dict(self):
+        """Test converting a batch of examples to dictionaries."""
+        examples = [
+            Example.create("Example 1", "Description 1"),
+            Example.create("Example 2"),
+        ]
 
-        example_dict = {
-            "id": "123",
-            "name": name,
-            "description": description,
-            "created_at": created_at.isoformat(),
-            "updated_at": updated_at.isoformat(),
-        }
+        dicts = Example.batch_to_dict(examples)
 
-        example = Example.from_dict(example_dict)
+        self.assertEqual(len(dicts), 2)
+        for example, example_dict in zip(examples, dicts):
+            self.assertEqual(example_dict, example.to_dict())
+
+    def test_from_dict(self):
+        """Test creating an example from a dictionary."""
+        example = Example.from_dict(self._example_dict)
 
         self.assertEqual(example.id, "123")
-        self.assertEqual(example.name, name)
-        self.assertEqual(example.description, description)
-        self.assertEqual(example.created_at, created_at)
-        self.assertEqual(example.updated_at, updated_at)
+        self.assertEqual(example.name, "Test Example")
+        self.assertEqual(example.description, "This is a test example")
+        self.assertEqual(example.created_at, self._created_at)
+        self.assertEqual(example.updated_at, self._updated_at)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Tests for the Example domain service.
 """
 import unittest
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 from domain.event.event_bus import EventBus
 from domain.model.errors import EntityNotFoundError, ExampleNameAlreadyExistsError
@@ -14,10 +14,20 @@ from domain.service.example_service_impl import ExampleServiceImpl
 class TestExampleService(unittest.TestCase):
     """Test cases for the Example domain service."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the mocked collaborators once for the class.
+
+        Mock(spec=...) introspects the spec class on every call, so the
+        mocks are created once and only reset between tests.
+        """
+        cls.repository = Mock(spec=ExampleRepository)
+        cls.event_bus = Mock(spec=EventBus)
+
     def setUp(self):
-        """Set up test fixtures before each test."""
-        self.repository = Mock(spec=ExampleRepository)
-        self.event_bus = Mock(spec=EventBus)
+        """Reset the shared mocks and build a fresh service for each test."""
+        self.repository.reset_mock(return_value=True, side_effect=True)
+        self.event_bus.reset_mock(return_value=True, side_effect=True)
         self.service = ExampleServiceImpl(self.repository, self.event_bus)
 
     def test_create_example(self):
@@ -53,6 +63,42 @@ class TestExampleService(unittest.TestCase):
         with self.assertRaises(ExampleNameAlreadyExistsError):
             self.service.create_example(name)
 
+    def test_create_examples(self):
+        """Test creating a batch of examples in one round trip."""
+        # Arrange
+        items = [("Example 1", "Description 1"), ("Example 2", None)]
+
+        self.repository.exists_by_names.return_value = set()
+        self.repository.save_many.side_effect = lambda examples: examples
+
+        # Act
+        result = self.service.create_examples(items)
+
+        # Assert
+        self.repository.exists_by_names.assert_called_once_with(
+            ["Example 1", "Example 2"]
+        )
+        self.repository.save_many.assert_called_once()
+        self.event_bus.publish_many.assert_called_once()
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0].name, "Example 1")
+        self.assertEqual(result[1].description, None)
+
+    def test_create_examples_name_exists(self):
+        """Test batch creation with a name that already exists."""
+        # Arrange
+        items = [("New Name", None), ("Existing Name", None)]
+
+        self.repository.exists_by_names.return_value = {"Existing Name"}
+
+        # Act & Assert
+        with self.assertRaises(ExampleNameAlreadyExistsError):
+            self.service.create_examples(items)
+
+        self.repository.save_many.assert_not_called()
+        self.event_bus.publish_many.assert_not_called()
+
     def test_update_example(self):
         """Test updating an example."""
         # Arrange
@@ -60,23 +106,21 @@ class TestExampleService(unittest.TestCase):
         name = "Test Example"
         description = "This is a test example"
 
-        existing_example = Example(
-            id=example_id, name="Old Name", description="Old Description"
-        )
-
         updated_example = Example(id=example_id, name=name, description=description)
 
-        self.repository.find_by_id.return_value = existing_example
-        self.repository.exists_by_name.return_value = False
-        self.repository.save.return_value = updated_example
+        self.repository.exists_by_name_excluding.return_value = False
+        self.repository.update_by_id.return_value = updated_example
 
         # Act
         result = self.service.update_example(example_id, name, description)
 
         # Assert
-        self.repository.find_by_id.assert_called_once_with(example_id)
-        self.repository.exists_by_name.assert_called_once_with(name)
-        self.repository.save.assert_called_once()
+        self.repository.exists_by_name_excluding.assert_called_once_with(
+            name, example_id
+        )
+        self.repository.update_by_id.assert_called_once_with(
+            example_id, name, description
+        )
         self.event_bus.publish.assert_called_once()
 
         self.assertEqual(result.id, example_id)
@@ -88,7 +132,8 @@ class TestExampleService(unittest.TestCase):
         # Arrange
         example_id = "123"
 
-        self.repository.find_by_id.return_value = None
+        self.repository.exists_by_name_excluding.return_value = False
+        self.repository.update_by_id.return_value = None
 
         # Act & Assert
         with self.assertRaises(EntityNotFoundError):
@@ -100,34 +145,25 @@ class TestExampleService(unittest.TestCase):
         example_id = "123"
         name = "Existing Name"
 
-        existing_example = Example(
-            id=example_id, name="Old Name", description="Old Description"
-        )
-
-        self.repository.find_by_id.return_value = existing_example
-        self.repository.exists_by_name.return_value = True
+        self.repository.exists_by_name_excluding.return_value = True
 
         # Act & Assert
         with self.assertRaises(ExampleNameAlreadyExistsError):
             self.service.update_example(example_id, name)
 
+        self.repository.update_by_id.assert_not_called()
+
     def test_delete_example(self):
         """Test deleting an example."""
         # Arrange
         example_id = "123"
 
-        example = Example(
-            id=example_id, name="Test Example", description="This is a test example"
-        )
-
-        self.repository.find_by_id.return_value = example
         self.repository.delete.return_value = True
 
         # Act
         result = self.service.delete_example(example_id)
 
         # Assert
-        self.repository.find_by_id.assert_called_once_with(example_id)
         self.repository.delete.assert_called_once_with(example_id)
         self.event_bus.publish.assert_called_once()
 
@@ -138,14 +174,13 @@ class TestExampleService(unittest.TestCase):
         # Arrange
         example_id = "123"
 
-        self.repository.find_by_id.return_value = None
+        self.repository.delete.return_value = False
 
         # Act
         result = self.service.delete_example(example_id)
 
         # Assert
-        self.repository.find_by_id.assert_called_once_with(example_id)
-        self.repository.delete.assert_not_called()
+        self.repository.delete.assert_called_once_with(example_id)
         self.event_bus.publish.assert_not_called()
 
         self.assertFalse(result)
@@ -169,6 +204,29 @@ class TestExampleService(unittest.TestCase):
 
         self.assertEqual(result.id, example_id)
 
+    def test_get_example_cached(self):
+        """Test that a repeat read is served from the process-local cache."""
+        # Arrange
+        example_id = "123"
+
+        example = Example(
+            id=example_id, name="Test Example", description="This is a test example"
+        )
+
+        self.repository.find_by_id.return_value = example
+
+        # Act
+        first = self.service.get_example(example_id)
+        second = self.service.get_example(example_id)
+
+        # Assert
+        self.repository.find_by_id.assert_called_once_with(example_id)
+
+        self.assertIs(first, example)
+        self.assertEqual(second.to_dict(), example.to_dict())
+        # The cached read is a copy, so mutating it cannot poison the cache
+        self.assertIsNot(second, example)
+
     def test_get_example_not_found(self):
         """Test getting a non-existent example."""
         # Arrange
@@ -180,6 +238,26 @@ class TestExampleService(unittest.TestCase):
         with self.assertRaises(EntityNotFoundError):
             self.service.get_example(example_id)
 
+    def test_get_examples_by_ids(self):
+        """Test getting several examples by their IDs in one round trip."""
+        # Arrange
+        examples = [
+            Example(id="1", name="Example 1"),
+            Example(id="2", name="Example 2"),
+        ]
+
+        self.repository.find_by_ids.return_value = examples
+
+        # Act
+        result = self.service.get_examples_by_ids(["1", "2", "missing"])
+
+        # Assert
+        self.repository.find_by_ids.assert_called_once_with(["1", "2", "missing"])
+
+        self.assertEqual(set(result), {"1", "2"})
+        self.assertIs(result["1"], examples[0])
+        self.assertIs(result["2"], examples[1])
+
     def test_get_all_examples(self):
         """Test getting all examples."""
         # Arrange
@@ -0,0 +1,112 @@
+"""
+Tests for the Clean Architecture validator.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from util.clean_arch import Layer, Validator
+
+# The validator treats imports that do not mention the application name
+# (the basename of the working directory) as third-party and skips them,
+# so the fixture imports are prefixed with it.
+_APP_NAME = os.path.basename(os.getcwd())
+
+# Prefer the tmpfs mount for fixture files so the walk/read cycle never
+# touches disk; fall back to the platform default elsewhere.
+_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Fixture payloads, encoded once at import instead of per write
+_DOMAIN_IMPORT = f"from {_APP_NAME}.domain.model.entity import Entity\n".encode()
+_APP_IMPORT = f"from {_APP_NAME}.application.service.service import Service\n".encode()
+_LEGACY_IMPORT = f"from {_APP_NAME}.application.legacy.service import Service\n".encode()
+
+
+class TestValidator(unittest.TestCase):
+    """Test cases for the Clean Architecture validator."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared fixture root and alias mapping once for the class.
+
+        Each test materializes its project under a uniquely named
+        subdirectory of the class-level temporary directory, so the
+        directory is created and removed once instead of per test.
+        """
+        cls._skeleton = tempfile.mkdtemp(dir=_TMP_ROOT)
+        cls.addClassCleanup(shutil.rmtree, cls._skeleton)
+        cls._made_dirs = set()
+        cls._alias = {
+            "domain": Layer.DOMAIN,
+            "application": Layer.APPLICATION,
+            "infrastructure": Layer.INFRASTRUCTURE,
+            "interfaces": Layer.INTERFACES,
+        }
+        # The validator is stateless apart from its path-keyed metadata
+        # cache, and every test uses unique paths, so one instance is
+        # shared by the whole class.
+        cls.validator = Validator(cls._alias)
+
+    def setUp(self):
+        """Create a per-test project root inside the shared directory."""
+        self.project_root = os.path.join(self._skeleton, self._testMethodName)
+        os.makedirs(self.project_root)
+
+    def create_file(self, relpath, payload):
+        """Write a fixture source file under the per-test project root.
+
+        Args:
+            relpath: Path of the file relative to the project root
+            payload: Source code to write, pre-encoded as bytes
+        """
+        path = os.path.join(self.project_root, relpath)
+        dirname = os.path.dirname(path)
+        if dirname not in self._made_dirs:
+            os.makedirs(dirname, exist_ok=True)
+            self._made_dirs.add(dirname)
+        # One open/write/close per file instead of the buffered file object
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+    def test_validate_single_pass(self):
+        """Test every validator scenario in one walk over one layout.
+
+        The layout holds a valid import, a layer violation, an ignored
+        package, an excluded directory and a test file; a single
+        validate call must count exactly the three processed files and
+        report exactly the one violation.
+        """
+        self.create_file("application/service/service.py", _DOMAIN_IMPORT)
+        self.create_file("domain/service/service.py", _APP_IMPORT)
+        self.create_file("domain/service/client.py", _LEGACY_IMPORT)
+        self.create_file(".git/config.py", _APP_IMPORT)
+        self.create_file("domain/service/service_test.py", _APP_IMPORT)
+
+        count, passed, errors = self.validator.validate(
+            self.project_root, ignore_tests=True, ignored_packages=["legacy"]
+        )
+
+        # .git and the test file are skipped, the other three are read
+        self.assertEqual(count, 3)
+        self.assertFalse(passed)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("anti-clean", str(errors[0]))
+        self.assertIn("domain/service/service.py", str(errors[0]))
+
+    def test_validate_defaults(self):
+        """Test that test files are processed when ignore_tests is off."""
+        self.create_file("domain/service/service_test.py", _APP_IMPORT)
+
+        count, passed, errors = self.validator.validate(self.project_root)
+
+        self.assertEqual(count, 1)
+        self.assertFalse(passed)
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests for the lightweight dependency injection primitives.
+"""
+import unittest
+
+from util.di import Configuration, Factory, Resource, SimpleContainer, Singleton
+
+
+class _Service:
+    """Trivial class used as a provider factory target."""
+
+    def __init__(self, name, dependency=None):
+        self.name = name
+        self.dependency = dependency
+
+
+class TestProviders(unittest.TestCase):
+    """Test cases for the provider types."""
+
+    def test_factory_builds_new_instances(self):
+        """Test that a factory returns a new instance per call."""
+        factory = Factory(_Service, "example")
+
+        first = factory()
+        second = factory()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.name, "example")
+
+    def test_singleton_caches_instance(self):
+        """Test that a singleton builds once and reuses the instance."""
+        singleton = Singleton(_Service, "example")
+
+        first = singleton()
+        second = singleton()
+
+        self.assertIs(first, second)
+
+    def test_singleton_reset(self):
+        """Test that reset drops the cached instance."""
+        singleton = Singleton(_Service, "example")
+
+        first = singleton()
+        singleton.reset()
+        second = singleton()
+
+        self.assertIsNot(first, second)
+
+    def test_provider_arguments_are_resolved(self):
+        """Test that provider arguments are resolved at call time."""
+        dependency = Singleton(_Service, "dependency")
+        service = Factory(_Service, "service", dependency=dependency)
+
+        result = service()
+
+        self.assertIs(result.dependency, dependency())
+
+    def test_resource_runs_once(self):
+        """Test that a resource factory only runs once."""
+        calls = []
+        resource = Resource(calls.append, "initialized")
+
+        resource()
+        resource()
+
+        self.assertEqual(calls, ["initialized"])
+
+
+class TestConfiguration(unittest.TestCase):
+    """Test cases for the configuration provider."""
+
+    def test_nested_selector(self):
+        """Test resolving a nested configuration value."""
+        config = Configuration()
+        config.from_dict({"db": {"mysql": {"url": "sqlite://"}}})
+
+        self.assertEqual(config.db.mysql.url(), "sqlite://")
+
+    def test_missing_key_resolves_to_none(self):
+        """Test that a missing key resolves to None instead of raising."""
+        config = Configuration()
+        config.from_dict({"db": {}})
+
+        self.assertIsNone(config.db.mysql.url())
+
+    def test_selectors_resolve_late(self):
+        """Test that selectors see values loaded after their creation."""
+        config = Configuration()
+        selector = config.redis.host
+
+        config.from_dict({"redis": {"host": "localhost"}})
+
+        self.assertEqual(selector(), "localhost")
+
+
+class TestSimpleContainer(unittest.TestCase):
+    """Test cases for the declarative container base class."""
+
+    def test_container_wiring(self):
+        """Test that class-level providers wire together."""
+
+        class Container(SimpleContainer):
+            config = Configuration()
+            dependency = Singleton(_Service, config.dependency.name)
+            service = Factory(_Service, "service", dependency=dependency)
+
+        container = Container()
+        container.config.from_dict({"dependency": {"name": "wired"}})
+
+        result = container.service()
+
+        self.assertEqual(result.dependency.name, "wired")
+        self.assertIs(result.dependency, container.dependency())
+
+    def test_reset_singletons(self):
+        """Test that reset_singletons drops every cached instance."""
+
+        class Container(SimpleContainer):
+            service = Singleton(_Service, "example")
+
+        first = Container.service()
+        Container.reset_singletons()
+        second = Container.service()
+
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Tests for the structured logging utilities.
+"""
+import io
+import json
+import logging
+import unittest
+from logging.handlers import QueueHandler
+
+import util.logger
+from util.logger import (
+    JsonFormatter,
+    StructuredLogRecord,
+    clear_request_context,
+    configure_logging,
+    get_request_context,
+    set_request_context,
+)
+
+
+def _make_record(msg="hello", **extras):
+    """Build a StructuredLogRecord for formatter tests."""
+    record = StructuredLogRecord(
+        "test.logger", logging.INFO, __file__, 10, msg, None, None
+    )
+    for key, value in extras.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestRequestContext(unittest.TestCase):
+    """Test cases for the request-scoped logging context."""
+
+    def tearDown(self):
+        clear_request_context()
+
+    def test_set_and_get_context(self):
+        """Test that set_request_context stores the given fields."""
+        set_request_context(request_id="req-1", user_id="user-1")
+
+        context = get_request_context()
+
+        self.assertEqual(context["request_id"], "req-1")
+        self.assertEqual(context["user_id"], "user-1")
+
+    def test_clear_context(self):
+        """Test that clear_request_context drops all fields."""
+        set_request_context(request_id="req-1")
+
+        clear_request_context()
+
+        self.assertEqual(get_request_context(), {})
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Test cases for the JSON log formatter."""
+
+    def setUp(self):
+        self.formatter = JsonFormatter()
+        self.addCleanup(clear_request_context)
+
+    def test_format_basic_fields(self):
+        """Test that the core record fields are serialized."""
+        data = json.loads(self.formatter.format(_make_record("something happened")))
+
+        self.assertEqual(data["level"], "INFO")
+        self.assertEqual(data["logger"], "test.logger")
+        self.assertEqual(data["message"], "something happened")
+        self.assertIn("timestamp", data)
+
+    def test_format_includes_request_context(self):
+        """Test that request context fields end up in the output."""
+        set_request_context(request_id="req-1", trace_id="trace-1")
+
+        data = json.loads(self.formatter.format(_make_record()))
+
+        self.assertEqual(data["request_id"], "req-1")
+        self.assertEqual(data["trace_id"], "trace-1")
+
+    def test_format_includes_extras(self):
+        """Test that extra record attributes are serialized."""
+        data = json.loads(self.formatter.format(_make_record(duration_ms=12)))
+
+        self.assertEqual(data["duration_ms"], 12)
+
+    def test_format_merges_fields_channel(self):
+        """Test that extras passed under 'fields' are merged directly."""
+        data = json.loads(
+            self.formatter.format(_make_record(fields={"duration_ms": 12, "rows": 3}))
+        )
+
+        self.assertEqual(data["duration_ms"], 12)
+        self.assertEqual(data["rows"], 3)
+
+    def test_record_generates_request_id(self):
+        """Test that a record outside a request gets a generated id."""
+        data = json.loads(self.formatter.format(_make_record()))
+
+        self.assertTrue(data["request_id"])
+
+
+class TestTextFormatter(unittest.TestCase):
+    """Test cases for the plain-text formatter."""
+
+    def setUp(self):
+        self.addCleanup(clear_request_context)
+
+    def test_renders_context_request_id(self):
+        """Test that a context request id shows up in text output."""
+        set_request_context(request_id="req-42")
+
+        output = util.logger._text_formatter.format(_make_record("hello"))
+
+        self.assertIn("[req-42]", output)
+
+    def test_defaults_without_context(self):
+        """Test that records without a request id render the default."""
+        output = util.logger._text_formatter.format(_make_record("hello"))
+
+        self.assertIn("[-]", output)
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Test cases for the root logger configuration helper."""
+
+    def setUp(self):
+        root_logger = logging.getLogger()
+        self._handlers = list(root_logger.handlers)
+        self._level = root_logger.level
+        self._factory = logging.getLogRecordFactory()
+
+    def tearDown(self):
+        util.logger._stop_queue_listener()
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        for handler in self._handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(self._level)
+        logging.setLogRecordFactory(self._factory)
+
+    def test_configure_json_logging(self):
+        """Test that configure_logging installs the JSON formatter."""
+        configure_logging(level="DEBUG", use_json=True)
+
+        root_logger = logging.getLogger()
+        listener = util.logger._queue_listener
+
+        self.assertEqual(root_logger.level, logging.DEBUG)
+        self.assertEqual(len(root_logger.handlers), 1)
+        self.assertIsInstance(root_logger.handlers[0], QueueHandler)
+        self.assertIsInstance(listener.handlers[0].formatter, JsonFormatter)
+        self.assertIs(logging.getLogRecordFactory(), StructuredLogRecord)
+
+    def test_exception_survives_the_queue(self):
+        """Test that exc_info reaches the formatter through the queue."""
+        configure_logging(level="INFO", use_json=True)
+        buffer = io.StringIO()
+        util.logger._queue_listener.handlers[0].setStream(buffer)
+        logger = logging.getLogger("test.pipeline")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("operation failed")
+        util.logger._stop_queue_listener()
+
+        data = json.loads(buffer.getvalue())
+        self.assertEqual(data["message"], "operation failed")
+        self.assertIn("ValueError: boom", data["exception"])
+
+    def test_reconfigure_with_same_settings_is_noop(self):
+        """Test that an identical reconfiguration keeps the handler."""
+        configure_logging(level="INFO", use_json=True)
+        handler = logging.getLogger().handlers[0]
+
+        configure_logging(level="INFO", use_json=True)
+
+        self.assertIs(logging.getLogger().handlers[0], handler)
+
+
+if __name__ == "__main__":
+    unittest.main()
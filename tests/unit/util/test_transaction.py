@@ -0,0 +1,85 @@
+"""
+Tests for the transaction management utilities.
+"""
+import unittest
+from unittest.mock import Mock
+
+from util.transaction import transaction_context, transactional
+
+
+class TestTransactionContext(unittest.TestCase):
+    """Test cases for the transaction context manager."""
+
+    def setUp(self):
+        self.session = Mock()
+
+    def test_commits_on_success(self):
+        """Test that a successful block commits the session."""
+        with transaction_context(self.session) as session:
+            self.assertIs(session, self.session)
+
+        self.session.commit.assert_called_once()
+        self.session.rollback.assert_not_called()
+
+    def test_rolls_back_on_failure(self):
+        """Test that a failing block rolls back and re-raises."""
+        with self.assertRaises(ValueError):
+            with transaction_context(self.session):
+                raise ValueError("boom")
+
+        self.session.rollback.assert_called_once()
+        self.session.commit.assert_not_called()
+
+
+class TestTransactional(unittest.TestCase):
+    """Test cases for the transactional decorator."""
+
+    def setUp(self):
+        self.session = Mock()
+
+    def test_commits_with_positional_session(self):
+        """Test that the session is found by its parameter position."""
+
+        @transactional
+        def save(session, value):
+            return value
+
+        result = save(self.session, 42)
+
+        self.assertEqual(result, 42)
+        self.session.commit.assert_called_once()
+
+    def test_commits_with_keyword_session(self):
+        """Test that the session is found when passed by keyword."""
+
+        @transactional
+        def save(value, session=None):
+            return value
+
+        save(42, session=self.session)
+
+        self.session.commit.assert_called_once()
+
+    def test_rolls_back_and_reraises_on_failure(self):
+        """Test that a failing function rolls back the session."""
+
+        @transactional
+        def fail(session):
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            fail(self.session)
+
+        self.session.rollback.assert_called_once()
+
+    def test_requires_session_parameter(self):
+        """Test that decorating a session-less function fails early."""
+        with self.assertRaises(TypeError):
+
+            @transactional
+            def no_session(value):
+                return value
+
+
+if __name__ == "__main__":
+    unittest.main()
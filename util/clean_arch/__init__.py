@@ -3,15 +3,10 @@ Clean Architecture validator package.
 
 This package provides tools to validate that a project adheres to
 Clean Architecture principles by analyzing dependencies between layers.
-"""
 
-from .clean_arch import (
-    Layer,
-    LayerMetadata,
-    ValidationError,
-    Validator,
-    parse_layer_metadata,
-)
+The re-exports are resolved lazily (PEP 562) so importing the package
+does not pay for the validator module until a name is actually used.
+"""
 
 __all__ = [
     "Layer",
@@ -20,3 +15,14 @@ __all__ = [
     "Validator",
     "parse_layer_metadata",
 ]
+
+
+def __getattr__(name):
+    """Resolve re-exported names on first access and cache them."""
+    if name in __all__:
+        from . import clean_arch
+
+        value = getattr(clean_arch, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,9 +5,15 @@ This module provides functionality to validate Clean Architecture rules in a pro
 It checks that dependencies between layers follow the correct hierarchy.
 """
 import ast
+import atexit
+import hashlib
+import json
 import logging
 import os
+import pickle
+import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 # Configure logger
@@ -35,10 +41,195 @@ LAYER_WEIGHTS = {
     Layer.INFRASTRUCTURE: 4,
 }
 
+# Forbidden (importer layer, imported layer) pairs, precomputed from the
+# weights so each import check is a single set-membership test.
+FORBIDDEN_PAIRS = frozenset(
+    (importer, imported)
+    for importer in Layer
+    for imported in Layer
+    if LAYER_WEIGHTS[imported] > LAYER_WEIGHTS[importer]
+)
+
+# Directories that are never worth descending into
+EXCLUDED_DIRS = frozenset({".git", ".venv", "__pycache__", "node_modules", "vendor"})
+
+# On-disk AST cache directory for warm re-runs (e.g. the CLI in CI).
+# Entries are keyed on the source digest plus the interpreter version,
+# so edits and interpreter upgrades invalidate naturally.
+_CACHE_DIR = os.environ.get("ARCHCHECK_CACHE_DIR", ".archcheck-cache")
+_CACHE_TAG = f"py{sys.version_info.major}{sys.version_info.minor}-v1"
+
+
+# Index mapping path -> [mtime_ns, digest], persisted alongside the AST
+# cache so warm runs can skip reading and hashing unchanged files.
+_STATE_FILE = "state.json"
+_state: Optional[Dict[str, list]] = None
+_state_dirty = False
+
+
+def _get_state() -> Dict[str, list]:
+    """Load the mtime index lazily, tolerating a missing or broken file."""
+    global _state
+    if _state is None:
+        try:
+            with open(os.path.join(_CACHE_DIR, _STATE_FILE), encoding="utf-8") as f:
+                _state = json.load(f)
+        except (OSError, ValueError):
+            _state = {}
+    return _state
+
+
+def _save_state() -> None:
+    """Persist the mtime index at interpreter exit, best effort."""
+    if not _state_dirty:
+        return
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(
+            os.path.join(_CACHE_DIR, _STATE_FILE), "w", encoding="utf-8"
+        ) as f:
+            json.dump(_state, f)
+    except OSError:
+        pass
+
+
+atexit.register(_save_state)
+
+
+def _load_cached_ast(cache_path: str) -> Optional[ast.AST]:
+    """Load a pickled AST from the disk cache, or None on any failure."""
+    try:
+        with open(cache_path, "rb") as cached:
+            return pickle.load(cached)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+
+
+def _store_cached_ast(cache_path: str, tree: ast.AST) -> None:
+    """Store a pickled AST in the disk cache, best effort."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as cached:
+            pickle.dump(tree, cached, pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PickleError):
+        pass
+
+
+@lru_cache(maxsize=4096)
+def _parse_file(path: str, mtime_ns: int) -> ast.AST:
+    """
+    Parse a Python file, caching the AST in memory and on disk.
+
+    Within a process, repeat validations of an unchanged file are served
+    from the lru cache keyed on path and mtime. Across processes, the
+    pickled AST is reused from the disk cache keyed on the source
+    digest, so warm re-runs skip parsing entirely.
+
+    Args:
+        path: Path to the file
+        mtime_ns: The file's st_mtime_ns at the time of the call
+
+    Returns:
+        The parsed AST
+    """
+    global _state_dirty
+
+    # Fast path: an unchanged mtime means the stored digest still holds,
+    # so the source is neither read nor hashed.
+    state = _get_state()
+    entry = state.get(path)
+    if entry is not None and entry[0] == mtime_ns:
+        cache_path = os.path.join(_CACHE_DIR, f"{entry[1]}-{_CACHE_TAG}.pickle")
+        tree = _load_cached_ast(cache_path)
+        if tree is not None:
+            return tree
+
+    with open(path, "rb") as file:
+        source = file.read()
+
+    digest = hashlib.sha256(source).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f"{digest}-{_CACHE_TAG}.pickle")
+
+    tree = _load_cached_ast(cache_path)
+    if tree is None:
+        tree = ast.parse(source, path)
+        _store_cached_ast(cache_path, tree)
+
+    state[path] = [mtime_ns, digest]
+    _state_dirty = True
+
+    return tree
+
+
+def _iter_python_files(root: str):
+    """
+    Yield (path, filename) for Python files under a root directory.
+
+    os.scandir surfaces the file type cached in the directory entry,
+    avoiding the per-entry stat os.walk pays, and excluded directories
+    are pruned before they are ever opened.
+
+    Args:
+        root: Root directory to scan
+
+    Yields:
+        Tuples of (full path, filename)
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError as e:
+            logger.error(f"Error scanning {current}: {e}")
+            continue
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in EXCLUDED_DIRS and not name.startswith("."):
+                        stack.append(entry.path)
+                elif name.endswith(".py") and not name.startswith("."):
+                    yield entry.path, name
+
+
+def _iter_imports(tree: ast.Module):
+    """
+    Yield imported module paths from a file's top-level statements.
+
+    Imports live at module scope or inside top-level if/try/with
+    blocks, so only those are scanned instead of walking every node of
+    every function and class body.
+
+    Args:
+        tree: Parsed module AST
+
+    Yields:
+        Imported module path strings
+    """
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            for name in node.names:
+                yield name.name
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                yield node.module
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            stack.extend(node.body)
+            stack.extend(getattr(node, "orelse", ()))
+            stack.extend(getattr(node, "finalbody", ()))
+            for handler in getattr(node, "handlers", ()):
+                stack.extend(handler.body)
+
 
 class LayerMetadata:
     """Contains information about directory module and software layer."""
 
+    __slots__ = ("module", "layer")
+
     def __init__(self, module: str = "", layer: Optional[Layer] = None):
         """
         Initialize layer metadata.
@@ -50,6 +241,10 @@ class LayerMetadata:
         self.module = module
         self.layer = layer
 
+    def __repr__(self) -> str:
+        """Return a debug representation of the metadata."""
+        return f"LayerMetadata(module={self.module!r}, layer={self.layer!r})"
+
 
 class ValidationError(Exception):
     """Represents an error when Clean Architecture rule is not kept."""
@@ -69,6 +264,11 @@ class Validator:
         """
         self.files_metadata: Dict[str, LayerMetadata] = {}
         self.alias = alias
+        # Hashable view of the alias mapping for the memoized resolver
+        self._alias_items = tuple(alias.items())
+        # Application name used to filter third-party imports, resolved
+        # once instead of per import
+        self._app_name = os.path.basename(os.getcwd())
 
     def validate(
         self, root: str, ignore_tests: bool = False, ignored_packages: List[str] = None
@@ -87,79 +287,95 @@ class Validator:
                 - Whether validation passed (True) or failed (False)
                 - List of validation errors
         """
-        if ignored_packages is None:
-            ignored_packages = []
-
         errors = []
         count = 0
 
-        for dirpath, _, filenames in os.walk(root):
-            for filename in filenames:
-                path = os.path.join(dirpath, filename)
+        for _path, file_errors in self._scan_files(root, ignore_tests, ignored_packages):
+            count += 1
+            errors.extend(file_errors)
 
-                # Skip ignored packages
-                if any(ignored in path for ignored in ignored_packages):
-                    continue
+        return count, len(errors) == 0, errors
 
-                # Only process Python files
-                if not filename.endswith(".py"):
-                    continue
+    def iter_violations(
+        self, root: str, ignore_tests: bool = False, ignored_packages: List[str] = None
+    ):
+        """
+        Yield validation errors lazily while scanning a path.
 
-                # Skip test files if requested
-                if ignore_tests and filename.endswith("_test.py"):
-                    continue
+        Unlike validate, nothing is materialized: fail-fast callers can
+        stop at the first violation and abandon the rest of the scan.
 
-                # Skip hidden files and vendor directories
-                if "/vendor/" in path or "/." in path:
-                    continue
+        Args:
+            root: Root directory to validate
+            ignore_tests: Whether to ignore test files
+            ignored_packages: List of packages to ignore
 
-                try:
-                    with open(path, "r", encoding="utf-8") as file:
-                        tree = ast.parse(file.read(), path)
-                except Exception as e:
-                    logger.error(f"Error parsing {path}: {e}")
-                    continue
+        Yields:
+            ValidationError instances as they are found
+        """
+        for _path, file_errors in self._scan_files(root, ignore_tests, ignored_packages):
+            yield from file_errors
+
+    def _scan_files(
+        self, root: str, ignore_tests: bool, ignored_packages: Optional[List[str]]
+    ):
+        """
+        Scan a path, yielding (path, errors) for each processed file.
+
+        Args:
+            root: Root directory to scan
+            ignore_tests: Whether to ignore test files
+            ignored_packages: List of packages to ignore
+
+        Yields:
+            Tuples of (file path, list of validation errors for it)
+        """
+        if ignored_packages is None:
+            ignored_packages = []
+
+        for path, filename in _iter_python_files(root):
+            # Skip ignored packages
+            if any(ignored in path for ignored in ignored_packages):
+                continue
+
+            # Skip test files if requested
+            if ignore_tests and filename.endswith("_test.py"):
+                continue
+
+            try:
+                tree = _parse_file(path, os.stat(path).st_mtime_ns)
+            except Exception as e:
+                logger.error(f"Error parsing {path}: {e}")
+                continue
+
+            # Layer metadata depends only on the directory, so files in
+            # the same package share one cached resolution
+            importer_meta = self.file_metadata(os.path.dirname(path))
+            logger.info(f"file: {path}, metadata: {importer_meta!r}")
+
+            if not importer_meta.layer or not importer_meta.module:
+                logger.warning(
+                    f"Cannot parse metadata for file {path}, meta: {importer_meta!r}"
+                )
+                yield path, []
+                continue
 
-                importer_meta = self.file_metadata(path)
-                logger.info(f"file: {path}, metadata: {importer_meta.__dict__}")
+            errors = []
+            seen = set()
 
-                count += 1
+            # Process the file's top-level imports; a module imported
+            # several times gets the same verdict, so check it once
+            for import_path in _iter_imports(tree):
+                if import_path in seen:
+                    continue
+                seen.add(import_path)
 
-                if not importer_meta.layer or not importer_meta.module:
-                    logger.warning(
-                        f"Cannot parse metadata for file {path}, meta: {importer_meta.__dict__}"
-                    )
+                if any(ignored in import_path for ignored in ignored_packages):
                     continue
 
-                # Process imports in the file
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for name in node.names:
-                            import_path = name.name
-                            if any(
-                                ignored in import_path for ignored in ignored_packages
-                            ):
-                                continue
-
-                            validation_errors = self.validate_import(
-                                import_path, importer_meta, path
-                            )
-                            errors.extend(validation_errors)
-
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            import_path = node.module
-                            if any(
-                                ignored in import_path for ignored in ignored_packages
-                            ):
-                                continue
-
-                            validation_errors = self.validate_import(
-                                import_path, importer_meta, path
-                            )
-                            errors.extend(validation_errors)
+                errors.extend(self.validate_import(import_path, importer_meta, path))
 
-        return count, len(errors) == 0, errors
+            yield path, errors
 
     def validate_import(
         self, import_path: str, importer_meta: LayerMetadata, path: str
@@ -181,23 +397,17 @@ class Validator:
         import_meta = self.file_metadata(import_path)
 
         # Skip third-party dependencies
-        app_name = os.path.basename(
-            os.getcwd()
-        )  # Equivalent to config.GlobalConfig.App.Name in Go
-        if app_name not in import_path:
+        # (self._app_name is the equivalent of config.GlobalConfig.App.Name in Go)
+        if self._app_name not in import_path:
             logger.debug(f"[{import_path}] filtered due to third party dependency")
             return []
 
-        # Check layer hierarchy
-        if import_meta.layer != importer_meta.layer:
-            import_hierarchy = LAYER_WEIGHTS.get(import_meta.layer, 0)
-            importer_hierarchy = LAYER_WEIGHTS.get(importer_meta.layer, 0)
-
-            if import_hierarchy > importer_hierarchy:
-                err = ValidationError(
-                    f"anti-clean [hit-0]: {path} import {import_meta.layer}({import_path}) to {importer_meta.layer}"
-                )
-                errors.append(err)
+        # Check layer hierarchy with the precomputed pair table
+        if (importer_meta.layer, import_meta.layer) in FORBIDDEN_PAIRS:
+            err = ValidationError(
+                f"anti-clean [hit-0]: {path} import {import_meta.layer}({import_path}) to {importer_meta.layer}"
+            )
+            errors.append(err)
 
         # Log results
         if not errors:
@@ -223,24 +433,33 @@ class Validator:
         if path in self.files_metadata:
             return self.files_metadata[path]
 
-        self.files_metadata[path] = parse_layer_metadata(path, self.alias)
+        self.files_metadata[path] = _parse_layer_metadata_cached(
+            path, self._alias_items
+        )
         return self.files_metadata[path]
 
 
-def parse_layer_metadata(path: str, alias: Dict[str, Layer]) -> LayerMetadata:
+@lru_cache(maxsize=None)
+def _parse_layer_metadata_cached(
+    path: str, alias_items: Tuple[Tuple[str, Layer], ...]
+) -> LayerMetadata:
     """
-    Parse metadata from a file path.
+    Resolve layer metadata for a path, memoized across validators.
+
+    The resolution is a pure function of the path and alias mapping, and
+    the same paths and import strings recur across runs, so results are
+    cached process-wide.
 
     Args:
         path: Path to parse
-        alias: Mapping from directory patterns to layers
+        alias_items: Alias mapping as a hashable tuple of items
 
     Returns:
         LayerMetadata object
     """
     metadata = LayerMetadata()
 
-    for alia, layer in alias.items():
+    for alia, layer in alias_items:
         if alia in path:
             if metadata.module and len(layer) < len(metadata.module):
                 continue
@@ -250,3 +469,17 @@ def parse_layer_metadata(path: str, alias: Dict[str, Layer]) -> LayerMetadata:
             break  # Assume one file belongs to one module
 
     return metadata
+
+
+def parse_layer_metadata(path: str, alias: Dict[str, Layer]) -> LayerMetadata:
+    """
+    Parse metadata from a file path.
+
+    Args:
+        path: Path to parse
+        alias: Mapping from directory patterns to layers
+
+    Returns:
+        LayerMetadata object
+    """
+    return _parse_layer_metadata_cached(path, tuple(alias.items()))
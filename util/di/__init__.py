@@ -0,0 +1,27 @@
+"""
+Lightweight dependency injection package.
+
+This package provides the in-repo replacement for dependency-injector:
+plain-object providers and a declarative container base class with no
+metaclass machinery.
+"""
+
+from .simple_container import (
+    Configuration,
+    ConfigurationOption,
+    Factory,
+    Provider,
+    Resource,
+    SimpleContainer,
+    Singleton,
+)
+
+__all__ = [
+    "Configuration",
+    "ConfigurationOption",
+    "Factory",
+    "Provider",
+    "Resource",
+    "SimpleContainer",
+    "Singleton",
+]
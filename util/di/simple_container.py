@@ -0,0 +1,235 @@
+"""
+Lightweight dependency injection primitives.
+
+This module provides a small, pure-Python replacement for the
+dependency-injector package: providers are plain objects declared as
+class attributes on a SimpleContainer subclass, with no metaclass
+reflection or attribute-interception descriptors. Startup cost is one
+module import and a handful of object allocations.
+"""
+from typing import Any, Callable, Dict, Tuple
+
+# Marker for "not built yet", distinct from a factory that returned None
+_UNSET = object()
+
+
+class Provider:
+    """Base class for providers that build a value from a factory."""
+
+    __slots__ = (
+        "_factory",
+        "_args",
+        "_kwargs",
+        "_provider_args",
+        "_provider_kwargs",
+        "_has_provider_args",
+    )
+
+    def __init__(self, factory: Callable, *args: Any, **kwargs: Any):
+        """
+        Initialize the provider.
+
+        Args:
+            factory: Callable that builds the value
+            *args: Positional arguments for the factory; Provider
+                instances among them are resolved at call time
+            **kwargs: Keyword arguments for the factory, resolved the
+                same way
+        """
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+        # Which arguments are providers never changes after
+        # construction, so the classification is done once here instead
+        # of per build.
+        self._provider_args = tuple(
+            (index, arg) for index, arg in enumerate(args) if isinstance(arg, Provider)
+        )
+        self._provider_kwargs = tuple(
+            (key, value) for key, value in kwargs.items() if isinstance(value, Provider)
+        )
+        self._has_provider_args = bool(self._provider_args) or bool(
+            self._provider_kwargs
+        )
+
+    def _build(self) -> Any:
+        """Resolve argument providers and invoke the factory."""
+        if not self._has_provider_args:
+            return self._factory(*self._args, **self._kwargs)
+
+        args = self._args
+        if self._provider_args:
+            args = list(args)
+            for index, provider in self._provider_args:
+                args[index] = provider()
+
+        kwargs = self._kwargs
+        if self._provider_kwargs:
+            kwargs = dict(kwargs)
+            for key, provider in self._provider_kwargs:
+                kwargs[key] = provider()
+
+        return self._factory(*args, **kwargs)
+
+    def __call__(self) -> Any:
+        """Build and return the value."""
+        return self._build()
+
+
+class Factory(Provider):
+    """Provider that builds a new instance on every call."""
+
+    __slots__ = ()
+
+
+class Singleton(Provider):
+    """Provider that builds its instance once and then reuses it."""
+
+    __slots__ = ("_instance",)
+
+    def __init__(self, factory: Callable, *args: Any, **kwargs: Any):
+        """
+        Initialize the singleton provider.
+
+        Args:
+            factory: Callable that builds the instance
+            *args: Positional arguments for the factory
+            **kwargs: Keyword arguments for the factory
+        """
+        super().__init__(factory, *args, **kwargs)
+        self._instance: Any = _UNSET
+
+    def __call__(self) -> Any:
+        """Return the cached instance, building it on first use."""
+        if self._instance is _UNSET:
+            self._instance = self._build()
+        return self._instance
+
+    def reset(self) -> None:
+        """Drop the cached instance so the next call rebuilds it."""
+        self._instance = _UNSET
+
+
+class Resource(Singleton):
+    """
+    Provider for one-time initialization work.
+
+    Semantically a Singleton whose factory is run for its side effects
+    (logging setup, registry configuration); kept as its own type so
+    declarations read the same as with dependency-injector.
+    """
+
+    __slots__ = ()
+
+
+class ConfigurationOption(Provider):
+    """A lazy selector into a Configuration, built by attribute access."""
+
+    __slots__ = ("_configuration", "_path", "_key")
+
+    def __init__(self, configuration: "Configuration", path: Tuple[str, ...]):
+        """
+        Initialize the selector.
+
+        Args:
+            configuration: The configuration the selector reads from
+            path: Chain of keys leading to the selected value
+        """
+        self._configuration = configuration
+        self._path = path
+        # The dotted key never changes, so join it once here rather
+        # than on every resolution.
+        self._key = ".".join(path)
+
+    def __getattr__(self, name: str) -> "ConfigurationOption":
+        """Extend the selector path by one key."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return ConfigurationOption(self._configuration, self._path + (name,))
+
+    def __call__(self) -> Any:
+        """Resolve the selected value, or None when a key is missing."""
+        return self._configuration.lookup(self._key)
+
+
+class Configuration:
+    """
+    Configuration provider backed by a plain dict.
+
+    Attribute access builds lazy selectors (config.db.mysql.url) that
+    other providers resolve at call time, so the configuration can be
+    loaded after the container class body has been evaluated.
+    """
+
+    __slots__ = ("_data", "_flat")
+
+    def __init__(self):
+        """Initialize an empty configuration."""
+        self._data: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+
+    def from_dict(self, data: Dict[str, Any]) -> None:
+        """
+        Load configuration values from a dictionary.
+
+        Every path through the nested dict (intermediate mappings
+        included) is flattened into a dotted-key map with an iterative
+        stack, so selector resolution is one dict lookup regardless of
+        nesting depth.
+
+        Args:
+            data: The configuration dictionary
+        """
+        self._data = data
+
+        flat: Dict[str, Any] = {}
+        stack = [((), data)]
+        while stack:
+            prefix, mapping = stack.pop()
+            for key, value in mapping.items():
+                path = prefix + (key,)
+                flat[".".join(path)] = value
+                if isinstance(value, dict):
+                    stack.append((path, value))
+        self._flat = flat
+
+    def get(self) -> Dict[str, Any]:
+        """Return the underlying configuration dictionary."""
+        return self._data
+
+    def lookup(self, key: str) -> Any:
+        """
+        Resolve a dotted configuration key.
+
+        Args:
+            key: Dotted path such as "db.mysql.url"
+
+        Returns:
+            The configured value, or None when the key is missing
+        """
+        return self._flat.get(key)
+
+    def __getattr__(self, name: str) -> ConfigurationOption:
+        """Build a lazy selector for the given top-level key."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return ConfigurationOption(self, (name,))
+
+
+class SimpleContainer:
+    """
+    Base class for declarative dependency injection containers.
+
+    Providers are declared as plain class attributes; they are shared by
+    all instances of the container class, which matches how a single
+    application-wide container is used in this project.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def reset_singletons(cls) -> None:
+        """Reset every Singleton provider declared on the container."""
+        for value in vars(cls).values():
+            if isinstance(value, Singleton):
+                value.reset()
@@ -0,0 +1,321 @@
+"""
+Structured logging utilities.
+
+This module provides JSON-formatted structured logging with
+request-scoped context (request id, trace id, user id, session id)
+attached to every log record, plus a helper for configuring the root
+logger.
+"""
+import atexit
+import json
+import logging
+import queue
+import time
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+# Bound once so the per-record time formatting skips module attribute
+# lookups.
+_localtime = time.localtime
+_strftime = time.strftime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+# Request-scoped context attached to every log record. ContextVars are
+# both thread- and task-safe, unlike a module-level dict, and reading
+# one with a default is a C-level operation.
+_request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+_trace_id_var: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+_user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
+_session_id_var: ContextVar[Optional[str]] = ContextVar("session_id", default=None)
+
+_CONTEXT_VARS = (
+    ("request_id", _request_id_var),
+    ("trace_id", _trace_id_var),
+    ("user_id", _user_id_var),
+    ("session_id", _session_id_var),
+)
+
+# Standard LogRecord attributes (plus the context fields handled
+# explicitly) that the extras scan must skip; frozenset membership is
+# O(1) versus a linear scan of a per-call list literal.
+_RESERVED_ATTRS = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "exc_text",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "message",
+        "module",
+        "msecs",
+        "msg",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "taskName",
+        "thread",
+        "threadName",
+        "request_id",
+        "trace_id",
+        "user_id",
+        "session_id",
+    }
+)
+
+
+def set_request_context(
+    request_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> None:
+    """
+    Set the request-scoped logging context.
+
+    Args:
+        request_id: Identifier of the current request
+        trace_id: Distributed tracing identifier
+        user_id: Identifier of the authenticated user
+        session_id: Identifier of the user session
+    """
+    _request_id_var.set(request_id)
+    _trace_id_var.set(trace_id)
+    _user_id_var.set(user_id)
+    _session_id_var.set(session_id)
+
+
+def get_request_context() -> Dict[str, Any]:
+    """Return the non-empty fields of the current logging context."""
+    return {
+        name: value
+        for name, var in _CONTEXT_VARS
+        if (value := var.get()) is not None
+    }
+
+
+def clear_request_context() -> None:
+    """Clear the request-scoped logging context."""
+    for _, var in _CONTEXT_VARS:
+        var.set(None)
+
+
+class StructuredLogRecord(logging.LogRecord):
+    """Log record that carries the request-scoped context attributes.
+
+    LogRecord itself keeps a __dict__, but storing three of the context
+    fields in slots avoids the dict resize their insertion would
+    otherwise trigger on every record. request_id deliberately lives in
+    the record __dict__ when the context provides one: %-style
+    formatting renders from __dict__, so a slot or property would be
+    invisible to the plain-text format.
+    """
+
+    __slots__ = ("trace_id", "user_id", "session_id")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        request_id = _request_id_var.get()
+        if request_id is not None:
+            self.__dict__["request_id"] = request_id
+        self.trace_id = _trace_id_var.get()
+        self.user_id = _user_id_var.get()
+        self.session_id = _session_id_var.get()
+
+    @property
+    def request_id(self) -> str:
+        """The request id, generated lazily when no request set one.
+
+        uuid4 reads from the OS random source; deferring it to first
+        access keeps record creation cheap for records that are
+        filtered before formatting. The value is written into the
+        record __dict__ (a property is a data descriptor, so plain
+        assignment would recurse into the getter) where %-style
+        formatting can also see it.
+        """
+        request_id = self.__dict__.get("request_id")
+        if request_id is None:
+            request_id = self.__dict__["request_id"] = str(uuid.uuid4())
+        return request_id
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders log records as single-line JSON objects."""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return the record creation time in ISO 8601 format.
+
+        Formats the timestamp logging already stored on the record
+        directly with time.strftime, avoiding the datetime object a
+        fromtimestamp().isoformat() round trip would allocate.
+        """
+        parts = _strftime("%Y-%m-%dT%H:%M:%S", _localtime(record.created))
+        return f"{parts}.{int(record.msecs):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as a JSON string.
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            The JSON-encoded record
+        """
+        # One literal builds the dict at its final size; the
+        # comprehension drops unset context fields in a single pass
+        # instead of four guarded inserts that each may resize.
+        log_data: Dict[str, Any] = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "trace_id": getattr(record, "trace_id", None),
+            "user_id": getattr(record, "user_id", None),
+            "session_id": getattr(record, "session_id", None),
+        }
+        log_data = {key: value for key, value in log_data.items() if value is not None}
+
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+
+        # Callers that pass extra={"fields": {...}} take an O(1) path:
+        # the whole mapping is merged with one C-level update. Extras
+        # passed as individual keys fall back to the set-difference
+        # scan of the record attributes.
+        record_dict = record.__dict__
+        fields = record_dict.get("fields")
+        if fields is not None:
+            log_data.update(fields)
+        else:
+            for key in record_dict.keys() - _RESERVED_ATTRS:
+                if key[0] != "_":
+                    log_data[key] = record_dict[key]
+
+        # orjson's C encoder is several times faster than the stdlib
+        # pure-Python one; logging handlers expect str, so decode once.
+        if orjson is not None:
+            return orjson.dumps(log_data, default=str).decode("utf-8")
+        return json.dumps(log_data, default=str)
+
+
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Formatters are stateless, so one instance of each is enough.
+_json_formatter = JsonFormatter()
+# The default keeps the format usable for records created before the
+# structured record factory is installed, with no per-record guard.
+_text_formatter = logging.Formatter(
+    "%(asctime)s [%(levelname)s] [%(name)s] [%(request_id)s] %(message)s",
+    defaults={"request_id": "-"},
+)
+
+# Last applied (level, use_json) pair and the handler it installed,
+# used to skip handler teardown on repeated identical configuration.
+_current_config: Optional[tuple] = None
+_installed_handler: Optional[logging.Handler] = None
+
+# Background listener that formats and writes queued records.
+_queue_listener: Optional[QueueListener] = None
+
+
+class _PreservingQueueHandler(QueueHandler):
+    """Queue handler that keeps exception info on queued records.
+
+    The stock prepare() formats the record with a default formatter,
+    baking the traceback into the message and clearing exc_info, which
+    would leave the listener-side formatter nothing to serialize. The
+    queue here is in-process, so the record can cross it intact; only
+    the message is pre-merged because args may be mutated after the
+    log call returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Stop the active queue listener, flushing queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def configure_logging(level: str = "INFO", use_json: bool = True) -> None:
+    """
+    Configure the root logger for structured logging.
+
+    Records are handed to a queue and formatted and written by a
+    background listener thread, so application threads never pay for
+    serialization or stream writes. Reconfiguring with unchanged
+    settings is a no-op, so repeated bootstrap calls (test suites,
+    plugins) do not rebuild handlers.
+
+    Args:
+        level: Logging level name, e.g. "INFO" or "DEBUG"
+        use_json: Whether to emit JSON lines instead of plain text
+    """
+    global _current_config, _installed_handler, _queue_listener
+
+    root_logger = logging.getLogger()
+    config = (level.upper(), use_json)
+    if config == _current_config and _installed_handler in root_logger.handlers:
+        return
+
+    root_logger.setLevel(_LEVELS.get(config[0], logging.INFO))
+
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    _stop_queue_listener()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_json_formatter if use_json else _text_formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _PreservingQueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+
+    _queue_listener = QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+
+    logging.setLogRecordFactory(StructuredLogRecord)
+
+    _current_config = config
+    _installed_handler = queue_handler
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger by name.
+
+    Args:
+        name: The logger name, typically __name__
+
+    Returns:
+        The logger instance
+    """
+    return logging.getLogger(name)
@@ -0,0 +1,87 @@
+"""
+Transaction management utilities.
+
+This module provides a decorator and a context manager that wrap a
+database session in a commit/rollback boundary.
+"""
+import functools
+import inspect
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class _TransactionContext:
+    """Commit/rollback boundary as a plain context manager class.
+
+    A hand-written __enter__/__exit__ pair skips the generator frame
+    and send() calls contextlib.contextmanager adds per with-block.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self, session):
+        self._session = session
+
+    def __enter__(self):
+        return self._session
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if exc_type is None:
+            self._session.commit()
+        else:
+            self._session.rollback()
+            logger.exception("Transaction rolled back")
+        return False
+
+
+def transaction_context(session) -> _TransactionContext:
+    """
+    Run a block inside a transaction boundary.
+
+    Commits the session when the block completes, rolls back and
+    re-raises when it fails.
+
+    Args:
+        session: The database session
+
+    Returns:
+        A context manager yielding the session
+    """
+    return _TransactionContext(session)
+
+
+def transactional(func: Callable) -> Callable:
+    """
+    Decorate a function to run inside a transaction boundary.
+
+    The position of the ``session`` parameter is resolved once at
+    decoration time, so calls fetch it by index instead of scanning
+    the arguments.
+
+    Args:
+        func: Function taking a ``session`` parameter
+
+    Returns:
+        The wrapped function
+    """
+    parameters = tuple(inspect.signature(func).parameters)
+    try:
+        session_index = parameters.index("session")
+    except ValueError:
+        raise TypeError(
+            f"@transactional requires a 'session' parameter on {func.__name__}"
+        ) from None
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        session = kwargs.get("session")
+        if session is None and len(args) > session_index:
+            session = args[session_index]
+        if session is None:
+            return func(*args, **kwargs)
+        with transaction_context(session):
+            return func(*args, **kwargs)
+
+    return wrapper